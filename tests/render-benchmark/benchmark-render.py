@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Render Benchmark for the Hybrid Worksheet Generator
+
+Purpose: Measure render cost of the worksheet generator across visual types,
+vector objects, object counts, problem counts and page counts.
+Every case records wall time, peak Python memory and output bytes.
+
+Usage:
+  python tests/render-benchmark/benchmark-render.py
+  python tests/render-benchmark/benchmark-render.py --quick --output results.json
+  python tests/render-benchmark/benchmark-render.py --compare baseline.json
+"""
+
+import argparse
+import datetime
+import io
+import itertools
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+VISUAL_TYPES = ['countable_objects', 'grouped_objects', 'array', 'number_line', 'fraction_circle']
+OBJECT_COUNTS = [5, 20, 50, 100]
+PROBLEM_COUNTS = [5, 25, 100]
+PREVIEW_DPIS = [36, 72, 150]
+PREVIEW_PROBLEMS = 10
+
+
+def load_generator():
+    """Import the worksheet_generator package from the repository root"""
+    sys.path.insert(0, str(REPO_ROOT))
+    import worksheet_generator
+    return worksheet_generator
+
+
+def make_visual(rng, visual_type, object_type, count):
+    """Build visual_data for a visual type holding roughly count objects"""
+    if visual_type == 'countable_objects':
+        return {'type': visual_type, 'object_type': object_type, 'objects': list(range(count))}
+    if visual_type == 'grouped_objects':
+        first = rng.randint(1, max(1, count - 1))
+        return {'type': visual_type, 'object_type': object_type, 'groups': [first, count - first]}
+    if visual_type == 'array':
+        cols = min(10, count)
+        return {'type': visual_type, 'object_type': object_type,
+                'rows': max(1, count // cols), 'cols': cols}
+    if visual_type == 'number_line':
+        start = rng.randint(0, 10)
+        return {'type': visual_type, 'start': start, 'end': start + count}
+    if visual_type == 'fraction_circle':
+        parts = max(2, min(count, 12))
+        return {'type': visual_type, 'total_parts': parts, 'shaded_parts': rng.randint(1, parts)}
+    raise ValueError(visual_type)
+
+
+def build_worksheet(wg, rng, problems, compact=False, page_cache=None):
+    """Create a quiet in-memory generator holding the given (question, answer, visual) problems"""
+    gen = wg.HybridWorksheetGenerator(None, 'Benchmark', 3, 'Benchmark', quiet=True,
+                                      openmoji_dir=str(REPO_ROOT / '.no-openmoji'), compact=compact,
+                                      page_cache=page_cache)
+    for question, answer, visual in problems:
+        gen.add_problem(question, answer, visual)
+    return gen
+
+
+def measure(render, repeats):
+    """Time render() repeats times, then once more under tracemalloc for peak memory"""
+    timings = []
+    output_bytes = 0
+    for _ in range(repeats):
+        started = time.perf_counter()
+        output_bytes = render()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    render()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'wall_ms': round(statistics.median(timings), 3),
+        'wall_ms_min': round(min(timings), 3),
+        'peak_kb': round(peak / 1024, 1),
+        'output_bytes': output_bytes,
+    }
+
+
+def worksheet_case(wg, problems, seed, compact=False):
+    """Return a render callable for a full worksheet document"""
+    def render():
+        gen = build_worksheet(wg, random.Random(seed), problems, compact)
+        return gen.render_worksheet().nbytes
+    return render
+
+
+def object_case(wg, object_type, count, replay=False):
+    """Return a render callable that draws one vector object count times, bypassing the icon cache.
+    
+    With replay=True the object's compiled display list is replayed instead of
+    calling its VectorGraphicsLibrary method.
+    """
+    from reportlab.pdfgen import canvas
+    draw = wg.get_display_list(object_type).replay if replay else wg.VECTOR_METHODS[object_type]
+
+    def render():
+        buffer = io.BytesIO()
+        c = canvas.Canvas(buffer)
+        for i in range(count):
+            draw(c, 50 + (i % 10) * 40, 700 - (i // 10) * 40, 15)
+        c.save()
+        return len(buffer.getvalue())
+    return render
+
+
+def run_suite(wg, seed, repeats, quick):
+    """Run every sweep and return the list of case results"""
+    rng = random.Random(seed)
+    object_counts = OBJECT_COUNTS[:2] if quick else OBJECT_COUNTS
+    problem_counts = PROBLEM_COUNTS[:2] if quick else PROBLEM_COUNTS
+    objects = sorted(wg.VECTOR_METHODS)
+    cases = []
+
+    def record(suite, name, params, render):
+        result = {'suite': suite, 'name': name, 'params': params}
+        result.update(measure(render, repeats))
+        cases.append(result)
+        print(f"  {name:<45} {result['wall_ms']:>9.2f} ms {result['peak_kb']:>9.1f} KB "
+              f"{result['output_bytes']:>9} B")
+
+    print("\n📊 Visual types x object count")
+    for visual_type in VISUAL_TYPES:
+        for count in object_counts:
+            visual = make_visual(rng, visual_type, 'apple', count)
+            problems = [('Benchmark problem', '1', visual)]
+            record('visual', f"visual/{visual_type}/{count}",
+                   {'visual_type': visual_type, 'object_count': count},
+                   worksheet_case(wg, problems, seed))
+
+    draw_count = 10 if quick else 100
+    print(f"\n📊 Vector objects (direct draw, {draw_count} each)")
+    for object_type in objects:
+        record('object', f"object/{object_type}",
+               {'object_type': object_type, 'object_count': draw_count},
+               object_case(wg, object_type, draw_count))
+
+    print(f"\n📊 Vector objects (display list replay, {draw_count} each)")
+    for object_type in objects:
+        record('object_replay', f"object_replay/{object_type}",
+               {'object_type': object_type, 'object_count': draw_count},
+               object_case(wg, object_type, draw_count, replay=True))
+
+    print("\n📊 Vector objects in a 10x10 array worksheet")
+    for object_type in objects:
+        visual = {'type': 'array', 'object_type': object_type, 'rows': 10, 'cols': 10}
+        record('object_array', f"object_array/{object_type}",
+               {'object_type': object_type, 'object_count': 100},
+               worksheet_case(wg, [('Array', '100', visual)], seed))
+
+    print("\n📊 Problem count (mixed problems)")
+    problems = []
+    for i in range(max(problem_counts)):
+        visual_type = VISUAL_TYPES[i % len(VISUAL_TYPES)]
+        object_type = objects[rng.randrange(len(objects))]
+        visual = make_visual(rng, visual_type, object_type, rng.randint(3, 10))
+        problems.append((f"Problem {i + 1}", str(i), visual))
+
+    def sheet_params(count):
+        """Case params for the first count problems, with the page count the layout gives them"""
+        pages = build_worksheet(wg, random.Random(seed), problems[:count]).layout().page_count
+        return {'problem_count': count, 'pages': pages}
+
+    for count in problem_counts:
+        record('pages', f"pages/{count}-problems", sheet_params(count),
+               worksheet_case(wg, problems[:count], seed))
+        record('compact', f"compact/{count}-problems", sheet_params(count),
+               worksheet_case(wg, problems[:count], seed, compact=True))
+
+    print("\n📊 Re-render after editing one problem, unchanged pages from the page cache")
+    for count in problem_counts:
+        problems_for_pages = problems[:count]
+        page_cache = wg.PageCache()
+        build_worksheet(wg, random.Random(seed), problems_for_pages, page_cache=page_cache).render_worksheet()
+        edits = itertools.count()
+        def render_edit(problems_for_pages=problems_for_pages, page_cache=page_cache, edits=edits):
+            edited = list(problems_for_pages)
+            question, answer, visual = edited[len(edited) // 2]
+            edited[len(edited) // 2] = (f"{question} (edit {next(edits)})", answer, visual)
+            gen = build_worksheet(wg, random.Random(seed), edited, page_cache=page_cache)
+            return gen.render_worksheet().nbytes
+        record('page_cache', f"page_cache/{count}-problems-edit", sheet_params(count), render_edit)
+
+    print("\n📊 First-page PNG preview (pillow backend) by DPI")
+    preview_problems = problems[:PREVIEW_PROBLEMS]
+    for dpi in PREVIEW_DPIS:
+        def render(dpi=dpi):
+            gen = build_worksheet(wg, random.Random(seed), preview_problems)
+            return len(gen.render_preview(1, dpi, backend='pillow'))
+        record('preview', f"preview/{dpi}dpi",
+               {'dpi': dpi, 'problem_count': len(preview_problems)}, render)
+
+    print("\n📊 SVG and HTML output (no PDF) against the PDF for the same problems")
+    for count in problem_counts:
+        problems_for_pages = problems[:count]
+        def render_html(problems_for_pages=problems_for_pages):
+            gen = build_worksheet(wg, random.Random(seed), problems_for_pages)
+            return len(gen.render_html().encode('utf-8'))
+        record('svg', f"html/{count}-problems", sheet_params(count), render_html)
+    def render_svg():
+        gen = build_worksheet(wg, random.Random(seed), preview_problems)
+        return len(gen.render_svg(1).encode('utf-8'))
+    record('svg', "svg/page1", {'problem_count': len(preview_problems)}, render_svg)
+
+    generate_count = 200 if quick else 2000
+    print(f"\n📊 Problem generation ({generate_count} problems, no rendering)")
+    from worksheet_generator.problems import OPERATIONS
+    for operation in OPERATIONS:
+        spec = {'operation': operation, 'count': generate_count, 'seed': seed, 'min': 1, 'max': 100}
+        record('problems', f"problems/{operation}/{generate_count}",
+               {'operation': operation, 'problem_count': generate_count},
+               lambda spec=spec: len(wg.generate_problems(spec)))
+
+    return cases
+
+
+def compare(results, baseline_path, threshold):
+    """Print per-case changes against a baseline results file; return the regressions"""
+    baseline = {case['name']: case for case in json.loads(Path(baseline_path).read_text())['cases']}
+    regressions = []
+    print(f"\n🔍 Compared with {baseline_path} (threshold {threshold:.0%})")
+    for case in results['cases']:
+        old = baseline.get(case['name'])
+        if not old:
+            continue
+        time_change = (case['wall_ms'] - old['wall_ms']) / old['wall_ms'] if old['wall_ms'] else 0
+        size_change = ((case['output_bytes'] - old['output_bytes']) / old['output_bytes']
+                       if old['output_bytes'] else 0)
+        flag = ''
+        if time_change > threshold or size_change > threshold:
+            flag = '  ⚠️  REGRESSION'
+            regressions.append(case['name'])
+        print(f"  {case['name']:<45} time {time_change:+7.1%}  size {size_change:+7.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark worksheet-generator.py rendering')
+    parser.add_argument('--seed', type=int, default=1234, help='Seed for generated problems')
+    parser.add_argument('--repeats', type=int, default=5, help='Timed runs per case')
+    parser.add_argument('--quick', action='store_true', help='Smaller sweep for smoke runs')
+    parser.add_argument('--output', help='Results file (default: results-YYYY-MM-DD.json here)')
+    parser.add_argument('--compare', metavar='BASELINE', help='Results file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Relative slowdown or growth that counts as a regression')
+    args = parser.parse_args()
+
+    wg = load_generator()
+    import reportlab
+
+    print(f"🏁 Benchmarking worksheet_generator v{wg.GENERATOR_VERSION} "
+          f"(seed={args.seed}, repeats={args.repeats})")
+    results = {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'generator_version': wg.GENERATOR_VERSION,
+        'python': platform.python_version(),
+        'reportlab': reportlab.Version,
+        'seed': args.seed,
+        'repeats': args.repeats,
+        'quick': args.quick,
+        'cases': run_suite(wg, args.seed, args.repeats, args.quick),
+    }
+
+    output = Path(args.output) if args.output else (
+        Path(__file__).parent / f"results-{datetime.date.today().isoformat()}.json")
+    output.write_text(json.dumps(results, indent=2) + '\n')
+    print(f"\n✅ Results saved to {output}")
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Startup Budget Check for the Hybrid Worksheet Generator
+
+Purpose: Keep cold start of worksheet-generator.py cheap for health checks
+and tooling. Fails (exit code 1) when:
+  - `--list-objects` loads reportlab, svglib, multiprocessing or any rendering module
+  - importing worksheet_generator.cli exceeds the import-time budget
+  - `worksheet-generator.py --list-objects` exceeds the cold-start budget
+    (measured over a bare `python -c pass`)
+
+Usage:
+  python tests/render-benchmark/check-startup-budget.py
+  python tests/render-benchmark/check-startup-budget.py --import-budget-ms 20 --startup-budget-ms 40
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPT = REPO_ROOT / 'worksheet-generator.py'
+
+# Modules that must stay unloaded when nothing is rendered
+FORBIDDEN_PREFIXES = (
+    'reportlab', 'svglib', 'multiprocessing', 'socketserver',
+    'worksheet_generator.vector', 'worksheet_generator.generator',
+    'worksheet_generator.service', 'worksheet_generator.caches',
+    'worksheet_generator.openmoji', 'worksheet_generator.metrics',
+)
+
+LIST_OBJECTS_PROBE = f"""
+import contextlib, io, json, sys
+sys.path.insert(0, {str(REPO_ROOT)!r})
+sys.argv = ['worksheet-generator.py', '--list-objects']
+from worksheet_generator.cli import main
+with contextlib.redirect_stdout(io.StringIO()):
+    main()
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def loaded_modules():
+    """Modules present after running --list-objects in a fresh interpreter"""
+    output = subprocess.run([sys.executable, '-c', LIST_OBJECTS_PROBE], check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def import_time_ms():
+    """Cumulative -X importtime for worksheet_generator.cli in a fresh interpreter"""
+    stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import worksheet_generator.cli'],
+                            cwd=REPO_ROOT, check=True, capture_output=True, text=True).stderr
+    for line in stderr.splitlines():
+        match = re.match(r'import time:\s+\d+\s+\|\s+(\d+)\s+\|\s*worksheet_generator\.cli$', line)
+        if match:
+            return int(match.group(1)) / 1000
+    raise RuntimeError('worksheet_generator.cli missing from -X importtime output')
+
+
+def best_wall_ms(args, runs):
+    """Fastest wall time over several runs of a command"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(args, check=True, stdout=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check worksheet generator cold-start budget')
+    parser.add_argument('--import-budget-ms', type=float, default=25.0,
+                        help='Budget for importing worksheet_generator.cli')
+    parser.add_argument('--startup-budget-ms', type=float, default=50.0,
+                        help='Budget for --list-objects over a bare interpreter start')
+    parser.add_argument('--runs', type=int, default=7, help='Runs per timing (best is used)')
+    args = parser.parse_args()
+
+    failures = []
+
+    heavy = [m for m in loaded_modules() if m.startswith(FORBIDDEN_PREFIXES)]
+    if heavy:
+        failures.append(f"--list-objects loaded rendering modules: {', '.join(heavy)}")
+    print(f"  Modules loaded by --list-objects:  {'OK' if not heavy else 'FAIL'}")
+
+    subprocess.run([sys.executable, '-c', 'import worksheet_generator.cli'],
+                   cwd=REPO_ROOT, check=True)  # warm the bytecode cache
+    import_ms = min(import_time_ms() for _ in range(args.runs))
+    print(f"  Import worksheet_generator.cli:    {import_ms:7.1f} ms (budget {args.import_budget_ms:.0f} ms)")
+    if import_ms > args.import_budget_ms:
+        failures.append(f"import took {import_ms:.1f} ms")
+
+    baseline_ms = best_wall_ms([sys.executable, '-c', 'pass'], args.runs)
+    startup_ms = best_wall_ms([sys.executable, str(SCRIPT), '--list-objects'], args.runs) - baseline_ms
+    print(f"  --list-objects over bare startup:  {startup_ms:7.1f} ms (budget {args.startup_budget_ms:.0f} ms)")
+    if startup_ms > args.startup_budget_ms:
+        failures.append(f"--list-objects took {startup_ms:.1f} ms over interpreter startup")
+
+    if failures:
+        print("\n❌ Startup budget exceeded:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\n✅ Startup budget met")
+
+
+if __name__ == '__main__':
+    main()
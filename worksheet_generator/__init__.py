@@ -0,0 +1,60 @@
+"""
+Hybrid Math Worksheet Generator
+Combines built-in vector graphics with optional OpenMoji support.
+Works immediately with built-in graphics, enhanced with OpenMoji if available.
+
+Importing the package is cheap: reportlab and the drawing code are loaded
+the first time one of the rendering names below is accessed.
+"""
+
+from .registry import (GENERATOR_VERSION, OBJECT_REGISTRY, OPENMOJI_CODES, THEME_OBJECTS,
+                       list_available_objects)
+
+# Public name -> submodule that defines it (imported on first access)
+_LAZY_ATTRIBUTES = {
+    'VectorGraphicsLibrary': 'vector',
+    'VECTOR_METHODS': 'vector',
+    'DisplayList': 'vector',
+    'DisplayListRecorder': 'vector',
+    'get_display_list': 'vector',
+    'IconFormCache': 'caches',
+    'OutputCache': 'caches',
+    'PageCache': 'caches',
+    'RenderMetrics': 'metrics',
+    'OpenMojiIndex': 'openmoji',
+    'OpenMojiDrawingCache': 'openmoji',
+    'openmoji_drawings': 'openmoji',
+    'Problem': 'problems',
+    'generate_problems': 'problems',
+    'iter_spec_problems': 'problems',
+    'spec_problems': 'problems',
+    'CanvasBackend': 'backends',
+    'SvgCanvas': 'svg',
+    'LayoutPlan': 'layout',
+    'plan_layout': 'layout',
+    'number_line_ticks': 'layout',
+    'HybridWorksheetGenerator': 'generator',
+    'create_sample_worksheets': 'generator',
+    'ClassSet': 'classset',
+    'variant_spec': 'classset',
+    'WorksheetServer': 'service',
+    'render_job': 'service',
+    'read_manifest': 'service',
+    'run_batch': 'service',
+    'watch_spec': 'service',
+    'main': 'cli',
+}
+
+__all__ = ['GENERATOR_VERSION', 'OBJECT_REGISTRY', 'OPENMOJI_CODES', 'THEME_OBJECTS',
+           'list_available_objects', *_LAZY_ATTRIBUTES]
+
+
+def __getattr__(name):
+    import importlib
+
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
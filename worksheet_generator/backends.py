@@ -0,0 +1,91 @@
+"""
+Non-PDF drawing backends.
+
+VectorGraphicsLibrary, display-list replay and draw_visual_for_problem only
+use a small part of the reportlab canvas API. CanvasBackend implements the
+state side of that API (colors, line width, fonts, saveState/restoreState,
+translate, paths and document structure); subclasses only implement the
+primitives - circle, ellipse, rect, line, drawPath, drawString and
+drawCentredString - in page coordinates (points, origin bottom-left).
+"""
+
+
+class BackendPath:
+    """Path recorded as ('M', x, y), ('L', x, y), ('C', x1, y1, x2, y2, x3, y3) and ('Z',) segments"""
+
+    def __init__(self):
+        self.segments = []
+
+    def moveTo(self, x, y):
+        self.segments.append(('M', x, y))
+
+    def lineTo(self, x, y):
+        self.segments.append(('L', x, y))
+
+    def curveTo(self, x1, y1, x2, y2, x3, y3):
+        self.segments.append(('C', x1, y1, x2, y2, x3, y3))
+
+    def close(self):
+        self.segments.append(('Z',))
+
+    def rect(self, x, y, width, height):
+        self.segments.extend((('M', x, y), ('L', x + width, y), ('L', x + width, y + height),
+                              ('L', x, y + height), ('Z',)))
+
+
+class CanvasBackend:
+    """Canvas state shared by the non-PDF backends"""
+
+    def __init__(self, pagesize):
+        self.page_width, self.page_height = pagesize
+        self.page = 1
+        self._states = []
+        self._init_state()
+
+    def _init_state(self):
+        """Reset colors, line width, font and origin to their defaults"""
+        self._fill = (0.0, 0.0, 0.0)
+        self._stroke = (0.0, 0.0, 0.0)
+        self._line_width = 1
+        self._font = ('Helvetica', 12)
+        self._origin = (0, 0)
+
+    def setFillColor(self, color):
+        self._fill = tuple(color.rgb())
+
+    def setStrokeColor(self, color):
+        self._stroke = tuple(color.rgb())
+
+    def setLineWidth(self, width):
+        self._line_width = width
+
+    def setFont(self, name, size):
+        self._font = (name, size)
+
+    def saveState(self):
+        self._states.append((self._fill, self._stroke, self._line_width, self._font, self._origin))
+
+    def restoreState(self):
+        self._fill, self._stroke, self._line_width, self._font, self._origin = self._states.pop()
+
+    def translate(self, dx, dy):
+        ox, oy = self._origin
+        self._origin = (ox + dx, oy + dy)
+
+    def beginPath(self):
+        return BackendPath()
+
+    def showPage(self):
+        self.page += 1
+
+    def setTitle(self, title):
+        pass
+
+    def bookmarkPage(self, key):
+        pass
+
+    def addOutlineEntry(self, title, key, level=0):
+        pass
+
+    def showOutline(self):
+        pass
@@ -0,0 +1,203 @@
+"""
+Per-document icon forms, the in-process page cache and the content-addressed output cache.
+"""
+
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+
+class IconFormCache:
+    """Per-document cache of icons drawn once as PDF Form XObjects"""
+
+    def __init__(self):
+        self.forms = {}
+        self.sources = {}
+        self.placed = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def form_bbox(size):
+        """Bounding box around an icon drawn at the origin (icons overhang their size)"""
+        pad = size * 0.5 + 12
+        return (-size - pad, -size - pad, size + pad, size + pad)
+
+    def define(self, c, key, draw_func, size, code=None):
+        """Name of the form for key, defining it on the canvas on first use.
+
+        The form is drawn with draw_func, or built from previously recorded
+        (operators, graphics states) when code is given (see sources).
+        """
+        name = self.forms.get(key)
+        if name is None:
+            self.misses += 1
+            name = 'icon_' + '_'.join(str(part) for part in key).replace('.', '_')
+            c.beginForm(name, *self.form_bbox(size))
+            if code is None:
+                draw_func(c, 0, 0, size)
+                # Between beginForm and endForm a reportlab canvas accumulates only
+                # form operators, and graphics states (alpha) are named per form;
+                # other backends (SvgCanvas) keep no operators to record
+                if hasattr(c, '_code'):
+                    code = (list(c._code), dict(c._extgstate._c))
+            else:
+                c._code.extend(code[0])
+                c._extgstate._c.update(code[1])
+            c.endForm()
+            self.forms[key] = name
+            self.sources[key] = (size, code)
+        else:
+            self.hits += 1
+        return name
+
+    def draw(self, c, key, draw_func, x, y, size):
+        """Place the cached form for key at (x, y), defining it on first use"""
+        name = self.define(c, key, draw_func, size)
+        self.placed[key] = name
+
+        c.saveState()
+        c.translate(x, y)
+        c.doForm(name)
+        c.restoreState()
+
+    def stats(self):
+        """Return hit/miss counts for reporting"""
+        return {'forms': len(self.forms), 'hits': self.hits, 'misses': self.misses}
+
+
+class PageCache:
+    """In-process LRU of rendered worksheet pages, keyed by page content hash.
+
+    An entry holds a page's PDF content operators together with the icon forms
+    and fonts they reference, so the page can be replayed into a later
+    document without being drawn again.
+    """
+
+    def __init__(self, max_pages=4096):
+        self.max_pages = max_pages
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the entry for key, or None on a miss"""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, entry):
+        """Store entry under key, dropping the least recently used pages over the cap"""
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_pages:
+            self.entries.popitem(last=False)
+
+    def stats(self):
+        """Return hit/miss counts for reporting"""
+        return {'pages': len(self.entries), 'hits': self.hits, 'misses': self.misses}
+
+
+class OutputCache:
+    """Content-addressed on-disk cache (PDFs, PNG previews, SVG and HTML) with a size cap and LRU eviction.
+    
+    Entries are written to a temp file and renamed into place, so concurrent
+    writers never expose partial files. Hits refresh the entry's mtime, which
+    eviction uses as the recency order.
+    
+    The cap is approximate when several processes share the directory: each
+    scans the directory once, then adds only its own writes to that total,
+    and rescans when it evicts. With N writers the directory can grow to
+    about N times max_bytes before one of them evicts.
+    """
+
+    def __init__(self, directory, max_bytes=512 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size_estimate = None
+
+    def path_for(self, key):
+        """Location of a cache entry (sharded by the first two hex digits)"""
+        return self.directory / key[:2] / f"{key}.bin"
+
+    def get(self, key):
+        """Return cached bytes for key, or None on a miss"""
+        path = self.path_for(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def put(self, key, data):
+        """Atomically store data under key, evicting old entries if over the cap"""
+        path = self.path_for(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp-', suffix='.bin')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+        if self._size_estimate is None:
+            self._size_estimate = self.total_bytes()
+        else:
+            self._size_estimate += len(data)
+        if self._size_estimate > self.max_bytes:
+            self.evict()
+
+    def _entries(self):
+        """(mtime, size, path) for every entry; files vanishing mid-scan are skipped"""
+        entries = []
+        # Every file in a shard is an entry, including .pdf entries of older releases
+        for path in self.directory.glob('*/*'):
+            if path.name.startswith('.tmp-'):
+                continue
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def total_bytes(self):
+        """Current size of all cache entries"""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits its cap"""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._size_estimate = total
+        return removed
+
+    def stats(self):
+        """Return hit/miss counts for reporting"""
+        return {'hits': self.hits, 'misses': self.misses}
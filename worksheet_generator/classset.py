@@ -0,0 +1,132 @@
+"""
+Class sets: per-student variants of one worksheet template, rendered in one process.
+"""
+
+import hashlib
+import random
+
+from .generator import HybridWorksheetGenerator
+
+
+def variant_spec(template, seed, student=None):
+    """Worksheet spec for one variant of a template.
+
+    Fixed problems are shuffled with the variant seed; each 'generate' spec is
+    re-seeded from it, so every variant gets its own problem set.
+    """
+    spec = {key: value for key, value in template.items() if key not in ('class_set', 'students')}
+    problems = list(template.get('problems', []))
+    random.Random(seed).shuffle(problems)
+    spec['problems'] = problems
+
+    generate = template.get('generate') or []
+    generate = [generate] if isinstance(generate, dict) else generate
+    spec['generate'] = [{**generate_spec, 'seed': seed * len(generate) + i}
+                        for i, generate_spec in enumerate(generate)]
+    if student:
+        spec['student'] = student
+    return spec
+
+
+class ClassSet:
+    """Variants of one template that share a process, canvas resources and icon forms.
+
+    Seeds come from seeds, or count up from the template's 'seed' for variants
+    (defaulting to one variant per student). students names each variant's
+    header and bookmark.
+    """
+
+    def __init__(self, template, variants=None, seeds=None, students=None,
+                 quiet=False, cache=None, metrics=None):
+        self.template = template
+        self.students = list(students or template.get('students') or [])
+        if seeds is None:
+            count = variants or len(self.students)
+            if not count:
+                raise ValueError("class set needs variants, seeds or students")
+            base_seed = template.get('seed', 0)
+            seeds = [base_seed + i for i in range(count)]
+        self.seeds = list(seeds)
+        self.quiet = quiet
+        self.generators = [
+            HybridWorksheetGenerator.from_spec(variant_spec(template, seed, self.student(i)),
+                                               quiet=quiet, cache=cache, metrics=metrics)
+            for i, seed in enumerate(self.seeds)
+        ]
+
+    def __len__(self):
+        return len(self.generators)
+
+    def student(self, index):
+        """Name for variant index, or None when the class set has no roster"""
+        return self.students[index] if index < len(self.students) else None
+
+    def label(self, index):
+        """Bookmark title for variant index"""
+        return self.student(index) or f"Variant {index + 1} (seed {self.seeds[index]})"
+
+    def content_hash(self, kind):
+        """Hash of every variant's content, for caching merged documents"""
+        digest = hashlib.sha256(kind.encode('utf-8'))
+        for i, gen in enumerate(self.generators):
+            digest.update(self.label(i).encode('utf-8'))
+            digest.update(gen.content_hash(kind).encode('ascii'))
+        return digest.hexdigest()
+
+    def _log(self, message):
+        """Print progress unless the class set is quiet"""
+        if not self.quiet:
+            print(message)
+
+    def _merged_pages(self, draw_section):
+        """Page drawer putting every variant into one canvas with a bookmark per student"""
+        first = self.generators[0]
+
+        def draw_pages(c):
+            c.setTitle(first.title)
+            for i, gen in enumerate(self.generators):
+                if i > 0:
+                    c.showPage()
+                key = f"variant_{i + 1}"
+                c.bookmarkPage(key)
+                c.addOutlineEntry(self.label(i), key, level=0)
+                # Share the first generator's icon forms across the whole document
+                gen.icon_cache = first.icon_cache
+                try:
+                    draw_section(gen)(c)
+                finally:
+                    if gen is not first:
+                        gen.icon_cache = None
+            c.showOutline()
+        return draw_pages
+
+    def generate_merged(self, output, answer_key_output=None):
+        """Render all variants into one PDF, plus one combined answer key if a path is given"""
+        first = self.generators[0]
+        stats = first._produce('class_set', output,
+                               self._merged_pages(lambda gen: gen._draw_worksheet_pages),
+                               content_key=self.content_hash('class_set'))
+        self._log(f"✅ Class set of {len(self)} worksheets generated: {first._describe_output(output)}")
+        first._log_icon_stats(stats)
+        if answer_key_output is not None:
+            first._produce('class_set_answer_key', answer_key_output,
+                           self._merged_pages(lambda gen: gen._draw_answer_key_pages),
+                           content_key=self.content_hash('class_set_answer_key'))
+            self._log(f"✅ Combined answer key generated: {first._describe_output(answer_key_output)}")
+        return stats
+
+    def output_paths(self, pattern):
+        """Expand a path pattern ({index}, {seed}, {student}) for every variant"""
+        return [pattern.format(index=i + 1, seed=seed, student=self.student(i) or f"variant-{i + 1}")
+                for i, seed in enumerate(self.seeds)]
+
+    def generate_individual(self, output_pattern, answer_key_pattern=None):
+        """Render each variant to its own file; returns the worksheet paths"""
+        outputs = self.output_paths(output_pattern)
+        answer_keys = self.output_paths(answer_key_pattern) if answer_key_pattern else [None] * len(self)
+        for gen, output, answer_key in zip(self.generators, outputs, answer_keys):
+            gen.generate_worksheet(output)
+            if answer_key is not None:
+                gen.generate_answer_key(answer_key)
+        self._log(f"✅ Class set of {len(self)} worksheets generated: {output_pattern}")
+        return outputs
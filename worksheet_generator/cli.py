@@ -0,0 +1,129 @@
+"""
+Command-line entry point. Heavy modules are imported only by the commands that render.
+"""
+
+import argparse
+import sys
+
+from .registry import THEME_OBJECTS, list_available_objects
+
+
+def _write_metrics(metrics, args):
+    """Write the --profile report and Prometheus textfile if requested"""
+    if metrics is None:
+        return
+    if args.profile:
+        metrics.write_json(args.profile)
+        print(f"⏱️  Timing report written: {args.profile}", file=sys.stderr)
+    if args.prometheus_textfile:
+        metrics.write_prometheus(args.prometheus_textfile)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Hybrid Math Worksheet Generator')
+    parser.add_argument('--create-samples', action='store_true', 
+                       help='Create sample worksheets')
+    parser.add_argument('--list-objects', action='store_true',
+                       help='List all available objects')
+    parser.add_argument('--layout', metavar='SPEC',
+                       help='Print the page layout of a JSON worksheet spec without rendering')
+    parser.add_argument('--watch', metavar='SPEC',
+                       help="Re-render a JSON worksheet spec to its 'output' whenever it changes")
+    parser.add_argument('--batch', metavar='MANIFEST',
+                       help='Render every worksheet described in a JSONL manifest')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Worker processes for --batch (default: CPU count)')
+    parser.add_argument('--chunksize', type=int, default=1,
+                       help='Jobs handed to a worker at a time for --batch')
+    parser.add_argument('--serve', action='store_true',
+                       help='Run a warm JSON-RPC render server on stdin/stdout')
+    parser.add_argument('--socket', metavar='PATH',
+                       help='With --serve, listen on a local Unix socket instead of stdio')
+    parser.add_argument('--preload-theme', metavar='THEME',
+                       help=f"With --serve, warm icons for a theme ({', '.join(THEME_OBJECTS)})")
+    parser.add_argument('--cache-dir', metavar='DIR',
+                       help='Serve repeated --batch/--serve worksheets from this output cache')
+    parser.add_argument('--cache-max-mb', type=int, default=512,
+                       help='Size cap for --cache-dir before LRU eviction (default: 512)')
+    parser.add_argument('--openmoji-cache-dir', metavar='DIR',
+                       help='Store parsed OpenMoji SVGs here so warm runs skip XML parsing')
+    parser.add_argument('--compact', action='store_true',
+                       help='Write smaller PDFs (binary compressed streams, shared icon forms)')
+    parser.add_argument('--profile', metavar='REPORT',
+                       help='Write a JSON timing report (per phase, problem and object type)')
+    parser.add_argument('--prometheus-textfile', metavar='FILE',
+                       help='Also export render metrics in Prometheus textfile format')
+    
+    args = parser.parse_args()
+    
+    if args.list_objects and not (args.serve or args.batch or args.watch or args.create_samples):
+        objects = list_available_objects()
+        print(f"\n📚 Available Objects ({len(objects)}):\n")
+        for i, obj in enumerate(objects, 1):
+            print(f"  {i:2d}. {obj}")
+        print()
+        return
+    if args.layout:
+        import json
+        
+        from .layout import plan_layout
+        from .problems import spec_problems
+        
+        with open(args.layout, encoding='utf-8') as f:
+            spec = json.load(f)
+        print(json.dumps(plan_layout(spec_problems(spec)).to_dict(), indent=2))
+        return
+    if not (args.serve or args.batch or args.watch or args.create_samples):
+        parser.print_help()
+        return
+    
+    # Everything below renders, so reportlab and the drawing code load from here on
+    from pathlib import Path
+    
+    from .metrics import RenderMetrics
+    from .openmoji import openmoji_drawings
+    
+    cache_max_bytes = args.cache_max_mb * 1024 * 1024
+    metrics = RenderMetrics() if (args.profile or args.prometheus_textfile) else None
+    if args.openmoji_cache_dir:
+        openmoji_drawings.disk_dir = Path(args.openmoji_cache_dir)
+    
+    if args.serve:
+        from .caches import OutputCache
+        from .service import WorksheetServer
+        
+        # Progress output goes to stderr so stdout carries only responses
+        protocol_out = sys.stdout
+        sys.stdout = sys.stderr
+        cache = OutputCache(args.cache_dir, cache_max_bytes) if args.cache_dir else None
+        server = WorksheetServer(preload_theme=args.preload_theme, cache=cache,
+                                 metrics=metrics, prometheus_path=args.prometheus_textfile,
+                                 compact=args.compact)
+        if args.socket:
+            server.serve_socket(args.socket)
+        else:
+            server.serve_stdio(protocol_out)
+        server.export_metrics(force=True)
+    elif args.watch:
+        from .service import watch_spec
+        
+        print(f"👀 Watching {args.watch} (Ctrl-C to stop)", file=sys.stderr)
+        try:
+            watch_spec(args.watch, compact=args.compact)
+        except KeyboardInterrupt:
+            pass
+    elif args.batch:
+        from .service import run_batch
+        
+        totals = run_batch(args.batch, workers=args.workers, chunksize=args.chunksize,
+                           cache_dir=args.cache_dir, cache_max_bytes=cache_max_bytes,
+                           metrics=metrics, openmoji_cache_dir=args.openmoji_cache_dir,
+                           compact=args.compact)
+        _write_metrics(metrics, args)
+        if totals['error']:
+            sys.exit(1)
+    else:
+        from .generator import create_sample_worksheets
+        
+        create_sample_worksheets(metrics=metrics, compact=args.compact)
+        _write_metrics(metrics, args)
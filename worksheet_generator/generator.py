@@ -0,0 +1,1317 @@
+"""
+Hybrid worksheet generator: lays out problems and renders PDFs.
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import math
+import os
+import time
+from pathlib import Path
+
+from reportlab import rl_config
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.pdfbase import pdfdoc
+from reportlab.pdfgen import canvas
+from reportlab.lib import colors
+
+from .caches import IconFormCache
+from .openmoji import OpenMojiIndex, openmoji_drawings
+from .layout import NUMBER_LINE_FONT_SIZE, NUMBER_LINE_LENGTH, iter_placed, number_line_ticks, plan_layout
+from .preview import PillowCanvas, choose_backend, rasterize_pdf
+from .problems import Problem, iter_spec_problems
+from .svg import SvgCanvas
+from .registry import GENERATOR_VERSION, OPENMOJI_CODES, list_available_objects
+from .vector import VECTOR_METHODS, VectorGraphicsLibrary, get_display_list, get_silhouette
+
+# Canonical JSON for content hashes
+_hash_encode = json.JSONEncoder(sort_keys=True, separators=(',', ':'), default=str).encode
+
+# Unit-circle geometry of fraction circles, per number of parts
+_fraction_geometries = {}
+
+
+def _fraction_geometry(total_parts):
+    """Spoke directions and each part's arc as Bezier segments on the unit circle.
+    
+    Part i spans the angles 2*pi*i/total_parts - pi/2 to 2*pi*(i+1)/total_parts - pi/2.
+    Arcs are split into pieces of at most 90 degrees, each one cubic curve
+    (x1, y1, x2, y2, x3, y3) starting where the previous one ends.
+    """
+    geometry = _fraction_geometries.get(total_parts)
+    if geometry is None:
+        step = 2 * math.pi / total_parts
+        pieces = math.ceil(step / (math.pi / 2) - 1e-9)
+        sweep = step / pieces
+        kappa = 4 / 3 * math.tan(sweep / 4)
+        spokes = []
+        arcs = []
+        for i in range(total_parts):
+            angle = step * i - math.pi / 2
+            spokes.append((math.cos(angle), math.sin(angle)))
+            curves = []
+            for _ in range(pieces):
+                end = angle + sweep
+                cos0, sin0, cos1, sin1 = math.cos(angle), math.sin(angle), math.cos(end), math.sin(end)
+                curves.append((cos0 - kappa * sin0, sin0 + kappa * cos0,
+                               cos1 + kappa * sin1, sin1 - kappa * cos1, cos1, sin1))
+                angle = end
+            arcs.append(tuple(curves))
+        geometry = _fraction_geometries[total_parts] = (tuple(spokes), tuple(arcs))
+    return geometry
+
+# Page decorations (header and footer) compiled to content stream operators on
+# reportlab canvases, shared by every later page and document in the process:
+# key -> {'code', 'fonts'}. Keys hold no worksheet text, only the page geometry
+# and which fixed parts are drawn, so the dict stays small.
+_page_templates = {}
+
+
+def _fonts_match(c, fonts):
+    """Whether c numbers fonts (psname -> internal name) as recorded, registering them in order"""
+    # Internal font names (/F1, /F2, ...) are assigned in order of first use
+    for psname, internal in sorted(fonts.items(), key=lambda item: (len(item[1]), item[1])):
+        if c._doc.getInternalFontName(psname) != internal:
+            return False
+    return True
+
+
+class StateTrackingCanvas(canvas.Canvas):
+    """Canvas that drops fill, stroke, line width and font changes that change nothing.
+    
+    reportlab already keeps this state in Python, saving and restoring it with
+    saveState/restoreState and resetting it for each page, so a setter can
+    compare against it before emitting an operator. elided counts the
+    operators dropped. Nothing is dropped inside a form: reportlab resets its
+    state there, but a form inherits the graphics state of the page placing it.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        # The page preamble sets a configured base color through the setters, so it must not be elided
+        self._eliding = False
+        self.elided = 0
+        super().__init__(*args, **kwargs)
+        self._eliding = True
+    
+    def _elides(self):
+        """Whether the tracked state is the state in effect, so setters may compare against it"""
+        return self._eliding and not self._formData
+    
+    @staticmethod
+    def _color_key(color):
+        """(r, g, b, alpha) for RGB colors and tuples, None for anything not compared"""
+        if isinstance(color, colors.CMYKColor):
+            return None
+        if isinstance(color, colors.Color):
+            return (color.red, color.green, color.blue, color.alpha)
+        if isinstance(color, (tuple, list)) and len(color) == 3:
+            return (*color, 1)
+        return None
+    
+    def _same_color(self, color, current, alpha_key):
+        key = self._color_key(color)
+        return (self._elides() and key is not None and key == self._color_key(current)
+                and self._extgstate.getValue(alpha_key) == key[3])
+    
+    def setFillColor(self, aColor, alpha=None):
+        if alpha is None and self._same_color(aColor, self._fillColorObj, 'ca'):
+            self.elided += 1
+            return
+        super().setFillColor(aColor, alpha)
+    
+    def setStrokeColor(self, aColor, alpha=None):
+        if alpha is None and self._same_color(aColor, self._strokeColorObj, 'CA'):
+            self.elided += 1
+            return
+        super().setStrokeColor(aColor, alpha)
+    
+    def setLineWidth(self, width):
+        if self._elides() and width == self._lineWidth:
+            self.elided += 1
+            return
+        super().setLineWidth(width)
+    
+    def setFont(self, psfontname, size, leading=None):
+        if leading is None:
+            leading = size * 1.2
+        if self._elides() and (psfontname, size, leading) == (self._fontname, self._fontsize, self._leading):
+            self.elided += 1
+            return
+        super().setFont(psfontname, size, leading)
+
+
+class _AccountedStream(pdfdoc.PDFStream):
+    """Page content stream that records its length as written into the file"""
+    
+    def __init__(self, record):
+        super().__init__()
+        self.record = record
+    
+    def format(self, document):
+        data = super().format(document)
+        # data is: dictionary, "\nstream\n", the encoded content, "endstream\n"
+        self.record['compressed_bytes'] = len(data) - data.index(b'\nstream\n') - len(b'\nstream\nendstream\n')
+        return data
+
+
+class AccountingCanvas(StateTrackingCanvas):
+    """Canvas that records the size of every page's content stream.
+    
+    stream_bytes is known when the page ends; compressed_bytes is filled in
+    as reportlab writes the stream on save, so nothing is compressed twice.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.page_bytes = []
+    
+    def showPage(self):
+        super().showPage()
+        page = self._doc.Pages.pages[-1]
+        record = {'page': len(self.page_bytes) + 1, 'stream_bytes': len(page.stream),
+                  'compressed_bytes': None}
+        # The stream PDFPage.check_format would create, with the same filters
+        contents = _AccountedStream(record)
+        if page.compression:
+            contents.filters = [pdfdoc.PDFBase85Encode, pdfdoc.PDFZCompress] if rl_config.useA85 else [pdfdoc.PDFZCompress]
+        contents.content = page.stream
+        contents.__Comment__ = "page stream"
+        page.Contents = contents
+        self.page_bytes.append(record)
+
+
+class HybridWorksheetGenerator:
+    """Hybrid generator supporting both vector graphics and OpenMoji"""
+    
+    # Level of detail: visuals with more objects than this, or icons smaller
+    # than LOD_MIN_SIZE, are drawn as simplified silhouettes
+    LOD_OBJECT_COUNT = 60
+    LOD_MIN_SIZE = 10
+    
+    def __init__(self, output_path, title, grade, topic, theme="default", 
+                 openmoji_dir='/mnt/skills/user/math-worksheet-generator/icons', quiet=False,
+                 cache=None, metrics=None, openmoji_manifest=None, openmoji_cache=None,
+                 student=None, compact=False, page_cache=None):
+        self.output_path = output_path
+        self.quiet = quiet
+        self.cache = cache
+        self.page_cache = page_cache
+        self.metrics = metrics
+        self.served_from_cache = False
+        self.title = title
+        self.grade = grade
+        self.topic = topic
+        self.theme = theme
+        self.student = student
+        self.compact = compact
+        self.problems = []
+        self.width, self.height = letter
+        self.margin = 0.75 * inch
+        
+        # OpenMoji support
+        self.openmoji_dir = Path(openmoji_dir)
+        self.openmoji_index = OpenMojiIndex.for_directory(self.openmoji_dir, openmoji_manifest)
+        self.openmoji_enabled = self.openmoji_index.available
+        self.openmoji_cache = openmoji_cache or openmoji_drawings
+        
+        # Vector graphics library
+        self.vector_lib = VectorGraphicsLibrary()
+        
+        # Object maps are module constants so they are built once per process
+        self.vector_methods = VECTOR_METHODS
+        self.openmoji_codes = OPENMOJI_CODES
+        
+        # Per-document icon form cache (created for each canvas)
+        self.icon_cache = None
+        self.icon_stats = None
+        
+        # Set while drawing onto canvases that cannot draw OpenMoji drawings (Pillow, SVG)
+        self.vector_only = False
+        
+        # Objects skipped because they fell outside the printable area (per document)
+        self.culled = 0
+        
+        # Size accounting for the last document produced, and per document kind
+        self.output_bytes = None
+        self.page_bytes = None
+        self.elided_ops = None
+        self.output_sizes = {}
+        
+        # Worksheet pages replayed from / drawn into the page cache (last document)
+        self.page_stats = None
+    
+    def add_problem(self, question_text, answer, visual_data=None):
+        """Add a problem with optional visual data"""
+        self.problems.append(Problem(len(self.problems) + 1, question_text, answer, visual_data))
+    
+    def add_problems(self, problems):
+        """Add every problem of an iterable (Problem records, spec dicts or tuples)"""
+        for item in problems:
+            self.problems.append(Problem.coerce(item, len(self.problems) + 1))
+    
+    @property
+    def answers(self):
+        """Answer key entries derived from the problems"""
+        return [{'number': problem.number, 'answer': problem.answer} for problem in self.problems]
+    
+    def has_openmoji_icon(self, object_type):
+        """Check if OpenMoji icon exists for this object"""
+        if not self.openmoji_enabled:
+            return False
+        code = self.openmoji_codes.get(object_type.lower())
+        if not code:
+            return False
+        return code in self.openmoji_index
+    
+    def draw_openmoji_icon(self, c, object_type, x, y, size=20):
+        """Draw OpenMoji SVG icon (needs svglib); returns False when it cannot be drawn"""
+        code = self.openmoji_codes.get(object_type.lower())
+        if not code or code not in self.openmoji_index:
+            return False
+        
+        drawing = self.openmoji_cache.get(self.openmoji_index, code, size)
+        if drawing is None:
+            return False
+        
+        from reportlab.graphics import renderPDF
+        
+        def draw(c, x, y, size):
+            renderPDF.draw(drawing, c, x - size, y - size)
+        
+        if self.icon_cache is None:
+            draw(c, x, y, size)
+        else:
+            self.icon_cache.draw(c, ('openmoji', code, size), draw, x, y, size)
+        return True
+    
+    def use_silhouettes(self, count, size):
+        """Whether a visual of count objects at size should use level-of-detail silhouettes"""
+        return count > self.LOD_OBJECT_COUNT or size < self.LOD_MIN_SIZE
+    
+    def is_printable(self, x, y):
+        """Whether a point lies inside the page margins"""
+        return (self.margin <= x <= self.width - self.margin
+                and self.margin <= y <= self.height - self.margin)
+    
+    def draw_themed_object(self, c, object_type, x, y, size=20, silhouette=False):
+        """Draw object using hybrid approach: OpenMoji → Vector → Circle fallback.
+        
+        Objects centered outside the printable area are culled (returns False).
+        """
+        if not self.is_printable(x, y):
+            self.culled += 1
+            if self.metrics is not None:
+                self.metrics.object_drawn(object_type.lower(), 'culled', 0.0)
+            return False
+        
+        if self.metrics is None:
+            self._draw_object_branch(c, object_type, x, y, size, silhouette)
+            return True
+        
+        started = time.perf_counter()
+        branch = self._draw_object_branch(c, object_type, x, y, size, silhouette)
+        self.metrics.object_drawn(object_type.lower(), branch, time.perf_counter() - started)
+        return True
+    
+    def draw_objects(self, c, object_type, points, size=20, silhouette=False):
+        """Draw object_type centered at each (x, y) of points.
+        
+        Icons that paint only same-colored rectangles are merged into one path,
+        which is smaller than placing each copy as a form; everything else is
+        drawn object by object with draw_themed_object.
+        """
+        key = object_type.lower()
+        batch = None
+        if silhouette or not (self.openmoji_enabled and not self.vector_only
+                              and self.has_openmoji_icon(object_type)):
+            display_list = (get_silhouette(key if key in self.vector_methods else 'circle') if silhouette
+                            else get_display_list(key))
+            batch = display_list.rect_batch(size)
+        if batch is None:
+            for x, y in points:
+                self.draw_themed_object(c, object_type, x, y, size=size, silhouette=silhouette)
+            return
+        
+        printable = [(x, y) for x, y in points if self.is_printable(x, y)]
+        culled = len(points) - len(printable)
+        self.culled += culled
+        started = time.perf_counter()
+        if printable:
+            display_list.replay_batch(c, batch, printable)
+        if self.metrics is not None:
+            branch = 'silhouette' if silhouette else ('vector' if key in self.vector_methods else 'circle')
+            elapsed = (time.perf_counter() - started) / max(len(printable), 1)
+            for _ in range(culled):
+                self.metrics.object_drawn(key, 'culled', 0.0)
+            for _ in printable:
+                self.metrics.object_drawn(key, branch, elapsed)
+    
+    @staticmethod
+    def _draw_centred_labels(c, labels, y):
+        """Draw (x, text) labels centered on a baseline in the current font.
+        
+        On a reportlab canvas they share one text object instead of opening one
+        per string; other backends draw them one by one.
+        """
+        if not hasattr(c, 'beginText'):
+            for label_x, text in labels:
+                c.drawCentredString(label_x, y, text)
+            return
+        text_object = c.beginText()
+        for label_x, text in labels:
+            text_object.setTextOrigin(label_x - c.stringWidth(text) / 2, y)
+            text_object.textOut(text)
+        c.drawText(text_object)
+    
+    def _draw_object_branch(self, c, object_type, x, y, size, silhouette=False):
+        """Draw an object and return which fallback branch drew it"""
+        key = object_type.lower()
+        if silhouette:
+            self._draw_silhouette(c, key if key in self.vector_methods else 'circle', x, y, size)
+            return 'silhouette'
+        
+        # Try OpenMoji first (if available and the canvas can draw SVG drawings)
+        if self.openmoji_enabled and not self.vector_only and self.has_openmoji_icon(object_type):
+            if self.draw_openmoji_icon(c, object_type, x, y, size):
+                return 'openmoji'
+        
+        # Fall back to vector graphics
+        if key in self.vector_methods:
+            self._draw_vector(c, key, x, y, size)
+            return 'vector'
+
+        # Final fallback to simple circle
+        self._draw_vector(c, 'circle', x, y, size)
+        return 'circle'
+
+    def _draw_vector(self, c, key, x, y, size):
+        """Replay a compiled vector object, reusing the document's icon form when available"""
+        display_list = get_display_list(key)
+        if self.icon_cache is None:
+            display_list.replay(c, x, y, size)
+        else:
+            # Forms are keyed by drawing function, so aliases share one resource
+            self.icon_cache.draw(c, (display_list.draw_func.__name__, size), display_list.replay,
+                                 x, y, size)
+    
+    def _draw_silhouette(self, c, key, x, y, size):
+        """Replay the level-of-detail silhouette of a vector object"""
+        silhouette = get_silhouette(key)
+        if self.icon_cache is None:
+            # Silhouettes leave their fill color set (forms keep it inside the form)
+            c.saveState()
+            silhouette.replay(c, x, y, size)
+            c.restoreState()
+        else:
+            self.icon_cache.draw(c, ('silhouette', silhouette.source.draw_func.__name__, size),
+                                 silhouette.replay, x, y, size)
+    
+    def draw_visual_for_problem(self, c, visual_data, x, y):
+        """Draw the visual elements for a problem"""
+        if not visual_data:
+            return y
+        
+        visual_type = visual_data.get('type')
+        
+        if visual_type == 'countable_objects':
+            objects = visual_data.get('objects', [])
+            object_type = visual_data.get('object_type', 'circle')
+            spacing = 40
+            items_per_row = 10
+            
+            points = [(x + (i % items_per_row) * spacing, y - (i // items_per_row) * spacing)
+                      for i in range(len(objects))]
+            self.draw_objects(c, object_type, points, size=15,
+                              silhouette=self.use_silhouettes(len(objects), 15))
+            
+            return y - (max(len(objects) - 1, 0) // items_per_row) * spacing - 50
+        
+        elif visual_type == 'grouped_objects':
+            groups = visual_data.get('groups', [])
+            object_type = visual_data.get('object_type', 'circle')
+            spacing = 40
+            group_spacing = 70
+            silhouette = self.use_silhouettes(sum(groups), 15)
+            
+            current_x = x
+            current_y = y
+            
+            for group_idx, group in enumerate(groups):
+                for i in range(group):
+                    self.draw_themed_object(c, object_type, current_x, current_y, size=15,
+                                            silhouette=silhouette)
+                    current_x += spacing
+                
+                if group_idx < len(groups) - 1:
+                    current_x += spacing / 2
+                    c.setFont("Helvetica-Bold", 20)
+                    c.drawString(current_x - 12, current_y - 8, "+")
+                    c.setFont("Helvetica", 11)
+                    current_x += spacing
+            
+            return current_y - 50
+        
+        elif visual_type == 'array':
+            rows = visual_data.get('rows', 3)
+            cols = visual_data.get('cols', 4)
+            object_type = visual_data.get('object_type', 'circle')
+            spacing = 35
+            
+            points = [(x + col * spacing, y - row * spacing) for row in range(rows) for col in range(cols)]
+            self.draw_objects(c, object_type, points, size=12,
+                              silhouette=self.use_silhouettes(rows * cols, 12))
+            
+            return y - (rows * spacing) - 20
+        
+        elif visual_type == 'number_line':
+            labels, minor_ticks = number_line_ticks(visual_data.get('start', 0), visual_data.get('end', 10))
+            
+            # Axis and labeled ticks as one path, unlabeled ticks as another
+            c.setLineWidth(2)
+            path = c.beginPath()
+            path.moveTo(x, y)
+            path.lineTo(x + NUMBER_LINE_LENGTH, y)
+            for offset, _ in labels:
+                path.moveTo(x + offset, y - 5)
+                path.lineTo(x + offset, y + 5)
+            c.drawPath(path, fill=0, stroke=1)
+            if minor_ticks:
+                c.setLineWidth(1)
+                path = c.beginPath()
+                for offset in minor_ticks:
+                    path.moveTo(x + offset, y - 3)
+                    path.lineTo(x + offset, y + 3)
+                c.drawPath(path, fill=0, stroke=1)
+            
+            c.setFont("Helvetica", NUMBER_LINE_FONT_SIZE)
+            self._draw_centred_labels(c, [(x + offset, text) for offset, text in labels], y - 20)
+            
+            c.setFont("Helvetica", 11)
+            return y - 50
+        
+        elif visual_type == 'fraction_circle':
+            total_parts = visual_data.get('total_parts', 4)
+            shaded_parts = visual_data.get('shaded_parts', 1)
+            radius = 40
+            
+            center_x = x + radius + 20
+            center_y = y - radius - 20
+            spokes, arcs = _fraction_geometry(max(total_parts, 1))
+            
+            def arc(path, parts):
+                for part in parts:
+                    for x1, y1, x2, y2, x3, y3 in part:
+                        path.curveTo(center_x + radius * x1, center_y + radius * y1,
+                                     center_x + radius * x2, center_y + radius * y2,
+                                     center_x + radius * x3, center_y + radius * y3)
+            
+            # The shaded parts are adjacent: one sector, filled before the outline so
+            # the outline and spokes stay whole on top of it
+            if shaded_parts > 0:
+                c.setFillColor(colors.HexColor('#4A90E2'))
+                path = c.beginPath()
+                path.moveTo(center_x, center_y)
+                path.lineTo(center_x + radius * spokes[0][0], center_y + radius * spokes[0][1])
+                arc(path, arcs[:shaded_parts])
+                path.close()
+                c.drawPath(path, fill=1, stroke=0)
+            
+            # Outline and spokes as one path
+            c.setStrokeColor(colors.black)
+            c.setLineWidth(2)
+            path = c.beginPath()
+            path.moveTo(center_x + radius * spokes[0][0], center_y + radius * spokes[0][1])
+            arc(path, arcs)
+            path.close()
+            for spoke_x, spoke_y in spokes:
+                path.moveTo(center_x, center_y)
+                path.lineTo(center_x + radius * spoke_x, center_y + radius * spoke_y)
+            c.drawPath(path, fill=0, stroke=1)
+            
+            c.setFillColor(colors.black)
+            c.setStrokeColor(colors.black)
+            return center_y - radius - 30
+        
+        return y
+    
+    def _log(self, message):
+        """Print progress unless the generator is quiet"""
+        if not self.quiet:
+            print(message)
+    
+    @staticmethod
+    def _describe_output(output):
+        """Human-readable name for a path or a writable stream"""
+        if hasattr(output, 'write'):
+            if hasattr(output, 'getbuffer'):
+                return f"in-memory buffer ({output.getbuffer().nbytes} bytes)"
+            return getattr(output, 'name', type(output).__name__)
+        return output
+    
+    def _draw_header(self, c, answer_key=False):
+        """Draw the shared page header and return the y where content starts.
+        
+        The rule, the Date field and the blank Name field are a page template;
+        the title, the grade/topic line and anything naming the student are
+        drawn over it.
+        """
+        top = self.height - self.margin
+        rule_offset = 40 if answer_key else 60
+        blank_name = not answer_key and not self.student
+        
+        def draw_static(c):
+            if not answer_key:
+                c.setFont("Helvetica", 10)
+                if blank_name:
+                    c.drawString(self.margin, top - 45, "Name: _________________")
+                c.drawString(self.width - self.margin - 120, top - 45, "Date: _________________")
+            c.setLineWidth(1)
+            c.line(self.margin, top - rule_offset, self.width - self.margin, top - rule_offset)
+        
+        self._draw_template(c, 'header', (answer_key, blank_name), draw_static)
+        
+        c.setFont("Helvetica-Bold", 20)
+        c.drawCentredString(self.width / 2, top, f"{self.title} - ANSWER KEY" if answer_key else self.title)
+        subtitle = f"Grade {self.grade} | {self.topic}"
+        # The answer key names the student in its subtitle, the worksheet in its Name field
+        if answer_key and self.student:
+            subtitle += f" | {self.student}"
+        c.setFont("Helvetica", 12)
+        c.drawCentredString(self.width / 2, top - 25, subtitle)
+        if not answer_key and self.student:
+            c.setFont("Helvetica", 10)
+            c.drawString(self.margin, top - 45, f"Name: {self.student}")
+        return top - rule_offset - (30 if answer_key else 40)
+    
+    def _draw_template(self, c, part, params, draw):
+        """Draw a static page decoration (part, given params) with draw(c).
+        
+        On reportlab canvases the operators draw(c) emits are compiled once per
+        process and appended to later pages as they are, whenever the document
+        numbers their fonts the same. They are recorded within saveState and
+        restoreState, without state elision, so they depend on no page's state.
+        """
+        if not hasattr(c, '_code'):
+            draw(c)
+            return
+        key = (part, self.width, self.height, self.margin, params)
+        template = _page_templates.get(key)
+        if template is not None and _fonts_match(c, template['fonts']):
+            c._code.extend(template['code'])
+            return
+        
+        start = len(c._code)
+        eliding = getattr(c, '_eliding', False)
+        c._eliding = False
+        c.saveState()
+        try:
+            draw(c)
+        finally:
+            c.restoreState()
+            c._eliding = eliding
+        code = c._code[start:]
+        ops = ' '.join(code) + ' '
+        _page_templates[key] = {
+            'code': code,
+            'fonts': {psname: internal for psname, internal in c._doc.fontMapping.items()
+                      if f"{internal} " in ops},
+        }
+    
+    def _phase(self, name):
+        """Context manager timing a pipeline phase when metrics are enabled"""
+        if self.metrics is None:
+            return contextlib.nullcontext()
+        return self.metrics.phase(name)
+    
+    # Fonts of worksheet pages, registered before anything is drawn
+    WORKSHEET_FONTS = ("Helvetica", "Helvetica-Bold", "Helvetica-Oblique")
+    
+    @classmethod
+    def _register_fonts(cls, c):
+        """Number the worksheet fonts up front on a reportlab canvas.
+        
+        Font objects are otherwise created on first use, in between icon forms,
+        while replayed pages register all their fonts before their forms; this
+        keeps drawn and replayed documents identical.
+        """
+        if hasattr(c, '_doc'):
+            for fontname in cls.WORKSHEET_FONTS:
+                c._doc.getInternalFontName(fontname)
+    
+    def _draw_worksheet_pages(self, c):
+        """Draw the worksheet header, problems and footer onto c"""
+        self._register_fonts(c)
+        # Pages are recorded as reportlab content operators; other backends draw them
+        if self.page_cache is not None and hasattr(c, '_code'):
+            with self._phase('layout'):
+                plan = self.layout()
+            self._draw_cached_pages(c, plan)
+            return
+        
+        with self._phase('header'):
+            self._draw_header(c)
+        
+        with self._phase('layout'):
+            plan = self.layout()
+        
+        with self._phase('problems'):
+            self._draw_problems(c, plan)
+        
+        with self._phase('footer'):
+            self._draw_footer(c)
+    
+    def layout(self):
+        """Paginate the problems without drawing; see layout.plan_layout"""
+        return plan_layout(self.problems, self.width, self.height, self.margin)
+    
+    def _draw_problems(self, c, plan):
+        """Draw every problem at the position the layout plan gives it"""
+        self._draw_placed(c, zip(self.problems, plan.boxes))
+    
+    def _draw_placed(self, c, placed):
+        """Draw (problem, box) pairs in order, closing the page with its footer when the box's page
+        changes; the caller draws the last page's footer"""
+        page = 1
+        for problem, box in placed:
+            if box['page'] != page:
+                self._draw_footer(c)
+                c.showPage()
+                page = box['page']
+            self._draw_planned_problem(c, problem, box)
+    
+    def _draw_planned_problem(self, c, problem, box):
+        """Draw one problem at its layout box, timed when metrics are enabled"""
+        if self.metrics is None:
+            self._draw_problem(c, problem, box['top'])
+        else:
+            visual_type = (problem.visual or {}).get('type')
+            with self.metrics.problem(problem.number, visual_type):
+                self._draw_problem(c, problem, box['top'])
+    
+    def _draw_page(self, c, page, plan):
+        """Draw just one worksheet page of a layout plan onto c"""
+        if not 1 <= page <= plan.page_count:
+            raise ValueError(f"Page {page} is out of range (worksheet has {plan.page_count} pages)")
+        self._draw_page_contents(c, page,
+                                 [(problem, box) for problem, box in zip(self.problems, plan.boxes)
+                                  if box['page'] == page])
+    
+    def _draw_page_contents(self, c, page, placed):
+        """Draw one page: the header on page 1, its (problem, box) pairs and the footer"""
+        if page == 1:
+            self._draw_header(c)
+        for problem, box in placed:
+            self._draw_planned_problem(c, problem, box)
+        self._draw_footer(c)
+    
+    def page_hash(self, page, placed):
+        """Hash of everything drawn on one worksheet page: header, footer, problems and boxes"""
+        digest = hashlib.sha256(_hash_encode({
+            'version': GENERATOR_VERSION,
+            'title': self.title,
+            'grade': self.grade,
+            'topic': self.topic,
+            'student': self.student,
+            'openmoji': str(self.openmoji_dir) if self.openmoji_enabled else None,
+            'page': page,
+        }).encode('utf-8'))
+        for problem, box in placed:
+            digest.update(_hash_encode((problem.number, problem.question, problem.answer,
+                                        problem.visual, box)).encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _draw_cached_pages(self, c, plan):
+        """Draw the worksheet page by page, replaying pages whose hash is in the page cache"""
+        pages = [[] for _ in range(plan.page_count)]
+        for problem, box in zip(self.problems, plan.boxes):
+            pages[box['page'] - 1].append((problem, box))
+        
+        self.page_stats = {'reused': 0, 'drawn': 0}
+        for page, placed in enumerate(pages, 1):
+            if page > 1:
+                c.showPage()
+            key = self.page_hash(page, placed)
+            entry = self.page_cache.get(key)
+            if entry is not None:
+                with self._phase('page_replay'):
+                    replayed = self._replay_page(c, entry)
+                if replayed:
+                    self.page_stats['reused'] += 1
+                    continue
+            with self._phase('pages'):
+                self.page_cache.put(key, self._record_page(c, page, placed))
+            self.page_stats['drawn'] += 1
+    
+    def _record_page(self, c, page, placed):
+        """Draw a page and capture its content operators, icon form operators and fonts for replay"""
+        start = len(c._code)
+        culled = self.culled
+        elided = c.elided
+        self.icon_cache.placed = {}
+        self._draw_page_contents(c, page, placed)
+        return {
+            'code': c._code[start:],
+            'forms': {key: self.icon_cache.sources[key] for key in self.icon_cache.placed},
+            'fonts': dict(c._doc.fontMapping),
+            'gstates': dict(c._extgstate._c),
+            'pdf_version': c._doc._pdfVersion,
+            'culled': self.culled - culled,
+            'elided': c.elided - elided,
+        }
+    
+    def _replay_page(self, c, entry):
+        """Append a recorded page to c; False if this document numbers its fonts differently"""
+        if not _fonts_match(c, entry['fonts']):
+            return False
+        # Define forms before touching the page accumulators: a form begun on an
+        # empty page resets them when it ends
+        names = [self.icon_cache.define(c, key, None, size, code)
+                 for key, (size, code) in entry['forms'].items()]
+        c._formsinuse.extend(names)
+        c._code.extend(entry['code'])
+        c.elided += entry['elided']
+        # Graphics states (alpha) are named per page, and colors with alpha raise the PDF version
+        c._extgstate._c.update(entry['gstates'])
+        c._doc._pdfVersion = max(c._doc._pdfVersion, entry['pdf_version'])
+        self.culled += entry['culled']
+        return True
+    
+    def _draw_problem(self, c, problem, current_y):
+        """Draw one problem at current_y and return the y for the next one"""
+        c.setFont("Helvetica-Bold", 12)
+        c.drawString(self.margin, current_y, f"{problem.number}.")
+        
+        c.setFont("Helvetica", 11)
+        question_x = self.margin + 30
+        c.drawString(question_x, current_y, problem.question)
+        
+        visual_y = current_y - 30
+        if problem.visual:
+            visual_y = self.draw_visual_for_problem(c, problem.visual, 
+                                                   question_x, visual_y)
+        
+        answer_y = visual_y - 20
+        c.setFont("Helvetica", 11)
+        c.drawString(question_x, answer_y, "Answer: _________________")
+        
+        return answer_y - 50
+    
+    def _draw_footer(self, c):
+        """Draw the attribution footer (a page template, drawn on every worksheet page)"""
+        footer_text = "Great job! You're doing awesome!"
+        if self.openmoji_enabled:
+            footer_text += " • Icons by OpenMoji (CC BY-SA 4.0)"
+        
+        def draw_static(c):
+            c.setFont("Helvetica-Oblique", 8)
+            c.drawCentredString(self.width / 2, self.margin - 20, footer_text)
+        
+        self._draw_template(c, 'footer', footer_text, draw_static)
+    
+    def _draw_answer_key_pages(self, c, answers=None):
+        """Draw the answer key header and answers onto c"""
+        with self._phase('answer_key'):
+            self._draw_answers(c, answers)
+    
+    def _draw_answers(self, c, answers=None):
+        """Draw the answer key page contents from (number, answer) pairs (default: the problems)"""
+        if answers is None:
+            answers = ((problem.number, problem.answer) for problem in self.problems)
+        current_y = self._draw_header(c, answer_key=True)
+        answers_per_column = 20
+        column_width = (self.width - 2 * self.margin) / 2
+        
+        c.setFont("Helvetica", 11)
+        
+        for i, (number, answer) in enumerate(answers):
+            if i > 0 and i % answers_per_column == 0:
+                if i % (answers_per_column * 2) == 0:
+                    c.showPage()
+                    current_y = self.height - self.margin
+                else:
+                    current_y = self.height - self.margin - 70
+            
+            column = (i // answers_per_column) % 2
+            x_pos = self.margin + (column * column_width)
+            row_in_column = i % answers_per_column
+            y_pos = current_y - (row_in_column * 25)
+            
+            c.drawString(x_pos, y_pos, f"{number}. {answer}")
+    
+    def content_hash(self, kind='worksheet'):
+        """Stable hash of everything that determines the rendered output"""
+        payload = {
+            'version': GENERATOR_VERSION,
+            'kind': kind,
+            'title': self.title,
+            'grade': self.grade,
+            'topic': self.topic,
+            'theme': self.theme,
+            'student': self.student,
+            'compact': self.compact,
+            'openmoji': str(self.openmoji_dir) if self.openmoji_enabled else None,
+        }
+        digest = hashlib.sha256(_hash_encode(payload).encode('utf-8'))
+        # Problems are hashed one at a time rather than serialized as one big list
+        for problem in self.problems:
+            digest.update(_hash_encode((problem.number, problem.question, problem.answer,
+                                        problem.visual)).encode('utf-8'))
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _write_output(output, data):
+        """Write finished PDF bytes to a path or writable stream"""
+        if hasattr(output, 'write'):
+            output.write(data)
+        else:
+            with open(output, 'wb') as f:
+                f.write(data)
+    
+    @staticmethod
+    def _output_size(output):
+        """Size in bytes of a finished document at a path or in a stream (None if unknown)"""
+        if hasattr(output, 'getbuffer'):
+            return output.getbuffer().nbytes
+        try:
+            return output.tell() if hasattr(output, 'tell') else os.path.getsize(output)
+        except (OSError, ValueError):
+            return None
+    
+    @contextlib.contextmanager
+    def _stream_encoding(self):
+        """In compact mode, write binary Flate streams instead of ASCII85-wrapped ones"""
+        if not self.compact:
+            yield
+            return
+        previous = rl_config.useA85
+        rl_config.useA85 = 0
+        try:
+            yield
+        finally:
+            rl_config.useA85 = previous
+    
+    def _begin_document(self, output):
+        """Create a canvas for output along with a fresh icon cache"""
+        self.icon_cache = IconFormCache()
+        self.culled = 0
+        if self.compact:
+            # invariant drops the timestamp and random ID, so equal content gives equal bytes
+            return AccountingCanvas(output, pagesize=letter, pageCompression=1, invariant=1)
+        return AccountingCanvas(output, pagesize=letter)
+    
+    def _finish_document(self, c):
+        """Save the canvas and collect the icon cache statistics"""
+        c.save()
+        self.page_bytes = c.page_bytes
+        self.elided_ops = c.elided
+        stats = self.icon_stats = self.icon_cache.stats()
+        self.icon_cache = None
+        return stats
+    
+    def _produce(self, kind, output, draw_pages, content_key=None, cacheable=True):
+        """Render one document via draw_pages, going through the output cache if set.
+        
+        content_key overrides content_hash(kind) as the cache key, for documents
+        drawn from more than this generator's problems; cacheable=False skips the
+        cache. Returns the icon cache statistics, or None when served from the cache.
+        """
+        self.served_from_cache = False
+        # Page cache statistics describe the worksheet pages; an answer key keeps them
+        if not kind.endswith('answer_key'):
+            self.page_stats = None
+        key = None
+        if self.cache is not None and cacheable:
+            with self._phase('cache_lookup'):
+                key = content_key or self.content_hash(kind)
+                data = self.cache.get(key)
+            if data is not None:
+                self._write_output(output, data)
+                self.served_from_cache = True
+                self.icon_stats = None
+                self.output_bytes = len(data)
+                self.page_bytes = None
+                self.elided_ops = None
+                self.output_sizes[kind] = {'bytes': self.output_bytes, 'page_bytes': None,
+                                           'elided_ops': None}
+                return None
+        
+        target = output if key is None else io.BytesIO()
+        with self._stream_encoding():
+            with self._phase('setup'):
+                c = self._begin_document(target)
+            draw_pages(c)
+            with self._phase('save'):
+                stats = self._finish_document(c)
+        self.output_bytes = self._output_size(target)
+        self.output_sizes[kind] = {'bytes': self.output_bytes,
+                                   'page_bytes': [page['compressed_bytes'] for page in self.page_bytes],
+                                   'elided_ops': self.elided_ops}
+        if self.metrics is not None:
+            self.metrics.document_finished(self.output_bytes, len(self.page_bytes), self.elided_ops)
+        
+        if key is not None:
+            data = target.getvalue()
+            self.cache.put(key, data)
+            self._write_output(output, data)
+        return stats
+    
+    def _log_icon_stats(self, stats):
+        """Report icon cache usage for a finished document"""
+        if stats is None:
+            self._log("   ♻️  Served from output cache")
+            return
+        self._log(f"   Icon cache: {stats['hits']} hits, {stats['misses']} misses "
+                  f"({stats['forms']} forms)")
+        if self.culled:
+            self._log(f"   ✂️  Culled {self.culled} objects outside the printable area")
+        if self.page_stats:
+            self._log(f"   ♻️  Page cache: {self.page_stats['reused']} pages reused, "
+                      f"{self.page_stats['drawn']} drawn")
+        if self.page_bytes:
+            pages = ', '.join(f"{page['compressed_bytes']:,}" for page in self.page_bytes)
+            self._log(f"   📄 {len(self.page_bytes)} pages, {self.output_bytes or 0:,} bytes "
+                      f"(page streams as written: {pages} bytes)")
+        if self.elided_ops:
+            self._log(f"   🧹 Dropped {self.elided_ops:,} redundant state operators")
+    
+    def generate_worksheet(self, output=None):
+        """Generate the main worksheet PDF to a path or writable binary stream"""
+        output = self.output_path if output is None else output
+        stats = self._produce('worksheet', output, self._draw_worksheet_pages)
+        self._log(f"✅ Worksheet generated: {self._describe_output(output)}")
+        self._log_icon_stats(stats)
+        return stats
+    
+    def generate_answer_key(self, answer_key_path):
+        """Generate the answer key PDF to a path or writable binary stream"""
+        self._produce('answer_key', answer_key_path, self._draw_answer_key_pages)
+        self._log(f"✅ Answer key generated: {self._describe_output(answer_key_path)}")
+    
+    def generate_stream(self, problems, output=None, answer_key_output=None):
+        """Render a worksheet from any iterable of problems, drawing each page as it fills.
+        
+        problems may be a generator of Problem records, spec dicts or
+        (question, answer, visual) tuples. They are laid out and drawn as they
+        are consumed and not kept; only (number, answer) pairs are retained for
+        the answer key. Streamed documents skip the output cache, whose key
+        needs the whole problem set up front.
+        """
+        output = self.output_path if output is None else output
+        answers = []
+        
+        def numbered():
+            for number, item in enumerate(problems, 1):
+                problem = Problem.coerce(item, number)
+                answers.append((number, problem.answer))
+                yield problem
+        
+        def draw_pages(c):
+            with self._phase('header'):
+                self._draw_header(c)
+            with self._phase('problems'):
+                self._draw_placed(c, iter_placed(numbered(), self.width, self.height, self.margin))
+            with self._phase('footer'):
+                self._draw_footer(c)
+        
+        stats = self._produce('worksheet', output, draw_pages, cacheable=False)
+        self._log(f"✅ Worksheet of {len(answers)} problems streamed: {self._describe_output(output)}")
+        self._log_icon_stats(stats)
+        if answer_key_output is not None:
+            self._produce('answer_key', answer_key_output,
+                          lambda c: self._draw_answer_key_pages(c, answers), cacheable=False)
+            self._log(f"✅ Answer key generated: {self._describe_output(answer_key_output)}")
+        return stats
+    
+    def _draw_combined_pages(self, c):
+        """Draw the worksheet followed by the answer key, with outline bookmarks"""
+        c.setTitle(self.title)
+        c.bookmarkPage('worksheet')
+        c.addOutlineEntry(self.title, 'worksheet', level=0)
+        self._draw_worksheet_pages(c)
+        
+        c.showPage()
+        c.bookmarkPage('answer_key')
+        c.addOutlineEntry('Answer Key', 'answer_key', level=0)
+        self._draw_answer_key_pages(c)
+        c.showOutline()
+    
+    def generate_with_answer_key(self, output=None, answer_key_output=None, combined=False):
+        """Generate the worksheet and its answer key in one call.
+        
+        With combined=True both sections go into a single PDF at output, sharing
+        one canvas, font resources and icon cache, with an outline bookmark for
+        each section. Otherwise the two files are written back to back.
+        """
+        output = self.output_path if output is None else output
+        if not combined:
+            stats = self.generate_worksheet(output)
+            self.generate_answer_key(answer_key_output)
+            return stats
+        
+        stats = self._produce('combined', output, self._draw_combined_pages)
+        self._log(f"✅ Worksheet and answer key generated: {self._describe_output(output)}")
+        self._log_icon_stats(stats)
+        return stats
+    
+    def render_worksheet(self, stream=None):
+        """Render the worksheet into stream, or into memory when no stream is given.
+        
+        Returns a memoryview over the rendered PDF (no extra copy) when rendering
+        to memory, otherwise the stream that was written to.
+        """
+        if stream is not None:
+            self.generate_worksheet(stream)
+            return stream
+        buffer = io.BytesIO()
+        self.generate_worksheet(buffer)
+        return buffer.getbuffer()
+    
+    def render_preview(self, page=1, dpi=72, backend='auto'):
+        """PNG bytes of one worksheet page, drawn without rendering the rest of the document.
+        
+        Previews go through the output cache when one is set; see preview.py
+        for the raster backends.
+        """
+        backend = choose_backend(backend)
+        key = None
+        self.served_from_cache = False
+        if self.cache is not None:
+            with self._phase('cache_lookup'):
+                key = hashlib.sha256(f"{self.content_hash()}:preview:{page}:{dpi}:{backend}"
+                                     .encode('utf-8')).hexdigest()
+                data = self.cache.get(key)
+            if data is not None:
+                self.served_from_cache = True
+                return data
+        
+        with self._phase('layout'):
+            plan = self.layout()
+        with self._phase('preview'):
+            if backend == 'pillow':
+                c = PillowCanvas((self.width, self.height), dpi)
+                self.vector_only = True
+                try:
+                    self._draw_page(c, page, plan)
+                finally:
+                    self.vector_only = False
+                data = c.png()
+            else:
+                buffer = io.BytesIO()
+                with self._stream_encoding():
+                    c = self._begin_document(buffer)
+                    self._draw_page(c, page, plan)
+                    c.save()
+                    self.icon_cache = None
+                data = rasterize_pdf(buffer.getvalue(), dpi, backend)
+        
+        if key is not None:
+            self.cache.put(key, data)
+        return data
+    
+    def _render_markup(self, tag, draw):
+        """Text output drawn onto an SvgCanvas by draw(c), going through the output cache if set"""
+        key = None
+        self.served_from_cache = False
+        if self.cache is not None:
+            with self._phase('cache_lookup'):
+                key = hashlib.sha256(f"{self.content_hash()}:{tag}".encode('utf-8')).hexdigest()
+                data = self.cache.get(key)
+            if data is not None:
+                self.served_from_cache = True
+                return data.decode('utf-8')
+        
+        c = SvgCanvas((self.width, self.height))
+        self.icon_cache = IconFormCache()
+        self.culled = 0
+        self.vector_only = True
+        try:
+            text = draw(c)
+        finally:
+            self.vector_only = False
+            self.icon_stats = self.icon_cache.stats()
+            self.icon_cache = None
+        
+        if key is not None:
+            self.cache.put(key, text.encode('utf-8'))
+        return text
+    
+    def render_svg(self, page=1):
+        """SVG markup for one worksheet page, drawn from the layout plan without a PDF"""
+        def draw(c):
+            with self._phase('layout'):
+                plan = self.layout()
+            with self._phase('svg'):
+                self._draw_page(c, page, plan)
+                return c.svg()
+        return self._render_markup(f"svg:{page}", draw)
+    
+    def render_html(self):
+        """Standalone HTML document with every worksheet page as inline SVG"""
+        def draw(c):
+            self._draw_worksheet_pages(c)
+            with self._phase('svg'):
+                return c.html(self.title)
+        return self._render_markup("html", draw)
+    
+    def render_answer_key(self, stream=None):
+        """Render the answer key into stream, or into memory (see render_worksheet)"""
+        if stream is not None:
+            self.generate_answer_key(stream)
+            return stream
+        buffer = io.BytesIO()
+        self.generate_answer_key(buffer)
+        return buffer.getbuffer()
+    
+    @classmethod
+    def from_spec(cls, spec, quiet=False, cache=None, metrics=None, stream=False, page_cache=None):
+        """Build a generator from a worksheet spec dict (as used by batch manifests).
+        
+        With stream=True the spec's problems are not loaded; pass
+        iter_spec_problems(spec) to generate_stream instead.
+        """
+        gen = cls(
+            output_path=spec.get('output'),
+            quiet=quiet,
+            cache=cache,
+            metrics=metrics,
+            page_cache=page_cache,
+            title=spec.get('title', 'Math Worksheet'),
+            grade=spec.get('grade', 1),
+            topic=spec.get('topic', ''),
+            theme=spec.get('theme', 'default'),
+            openmoji_manifest=spec.get('openmoji_manifest'),
+            student=spec.get('student'),
+            compact=spec.get('compact', False),
+            **({'openmoji_dir': spec['openmoji_dir']} if spec.get('openmoji_dir') else {})
+        )
+        if not stream:
+            gen.add_problems(iter_spec_problems(spec))
+        return gen
+    
+    @classmethod
+    def list_available_objects(cls):
+        """List all available objects from the static object registry"""
+        return list_available_objects()
+
+
+def create_sample_worksheets(metrics=None, compact=False):
+    """Create comprehensive sample worksheets"""
+    
+    print("Creating sample worksheets with hybrid approach...")
+    
+    # Grade 1: Food theme
+    gen1 = HybridWorksheetGenerator(
+        output_path='/mnt/user-data/outputs/hybrid_grade1_food.pdf',
+        title='Addition Practice - Food Fun!',
+        grade=1,
+        topic='Addition within 10',
+        theme='food',
+        metrics=metrics,
+        compact=compact
+    )
+    
+    gen1.add_problem(
+        question_text="Count all the apples:",
+        answer="7 apples",
+        visual_data={'type': 'countable_objects', 'object_type': 'apple', 'objects': list(range(7))}
+    )
+    
+    gen1.add_problem(
+        question_text="How many strawberries in total?",
+        answer="3 + 2 = 5",
+        visual_data={'type': 'grouped_objects', 'object_type': 'strawberry', 'groups': [3, 2]}
+    )
+    
+    gen1.add_problem(
+        question_text="Count the cookies:",
+        answer="9 cookies",
+        visual_data={'type': 'countable_objects', 'object_type': 'cookie', 'objects': list(range(9))}
+    )
+    
+    gen1.add_problem(
+        question_text="Add the pizza slices:",
+        answer="4 + 3 = 7",
+        visual_data={'type': 'grouped_objects', 'object_type': 'pizza', 'groups': [4, 3]}
+    )
+    
+    gen1.generate_worksheet()
+    gen1.generate_answer_key('/mnt/user-data/outputs/hybrid_grade1_food_answers.pdf')
+    
+    # Grade 2: Animals theme
+    gen2 = HybridWorksheetGenerator(
+        output_path='/mnt/user-data/outputs/hybrid_grade2_animals.pdf',
+        title='Counting Animals',
+        grade=2,
+        topic='Counting and Basic Addition',
+        theme='animals',
+        metrics=metrics,
+        compact=compact
+    )
+    
+    gen2.add_problem(
+        question_text="Count the dogs:",
+        answer="8 dogs",
+        visual_data={'type': 'countable_objects', 'object_type': 'dog', 'objects': list(range(8))}
+    )
+    
+    gen2.add_problem(
+        question_text="How many cats and rabbits together?",
+        answer="5 + 4 = 9",
+        visual_data={'type': 'grouped_objects', 'object_type': 'cat', 'groups': [5, 4]}
+    )
+    
+    gen2.add_problem(
+        question_text="Count all the bears:",
+        answer="6 bears",
+        visual_data={'type': 'countable_objects', 'object_type': 'bear', 'objects': list(range(6))}
+    )
+    
+    gen2.generate_worksheet()
+    gen2.generate_answer_key('/mnt/user-data/outputs/hybrid_grade2_animals_answers.pdf')
+    
+    # Grade 3: Mixed theme multiplication
+    gen3 = HybridWorksheetGenerator(
+        output_path='/mnt/user-data/outputs/hybrid_grade3_multiplication.pdf',
+        title='Multiplication Arrays',
+        grade=3,
+        topic='Multiplication Facts',
+        theme='mixed',
+        metrics=metrics,
+        compact=compact
+    )
+    
+    gen3.add_problem(
+        question_text="How many fish in the array? ___ × ___ = ___",
+        answer="3 × 4 = 12",
+        visual_data={'type': 'array', 'object_type': 'fish', 'rows': 3, 'cols': 4}
+    )
+    
+    gen3.add_problem(
+        question_text="Count the stars: ___ × ___ = ___",
+        answer="2 × 6 = 12",
+        visual_data={'type': 'array', 'object_type': 'star', 'rows': 2, 'cols': 6}
+    )
+    
+    gen3.add_problem(
+        question_text="How many butterflies? ___ × ___ = ___",
+        answer="3 × 3 = 9",
+        visual_data={'type': 'array', 'object_type': 'butterfly', 'rows': 3, 'cols': 3}
+    )
+    
+    gen3.add_problem(
+        question_text="Count the hearts: ___ × ___ = ___",
+        answer="4 × 2 = 8",
+        visual_data={'type': 'array', 'object_type': 'heart', 'rows': 4, 'cols': 2}
+    )
+    
+    gen3.generate_worksheet()
+    gen3.generate_answer_key('/mnt/user-data/outputs/hybrid_grade3_multiplication_answers.pdf')
+    
+    print("\n✅ All sample worksheets created!")
+    print("\nAvailable objects in vector library:")
+    objects = HybridWorksheetGenerator.list_available_objects()
+    for i, obj in enumerate(objects, 1):
+        print(f"  {i:2d}. {obj}")
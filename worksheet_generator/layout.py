@@ -0,0 +1,196 @@
+"""
+Layout dry run: measure problems from their visual_data and paginate without a canvas.
+
+The measurements mirror HybridWorksheetGenerator.draw_visual_for_problem, and
+the renderer draws each problem at the position the plan gives it, so a plan's
+page count is the rendered page count. Nothing here imports reportlab.
+"""
+
+import math
+
+# US letter in points (reportlab's pagesizes.letter) and the generator's 0.75 inch margin
+PAGE_WIDTH, PAGE_HEIGHT = 612.0, 792.0
+MARGIN = 54.0
+
+# Worksheet header: rule 60pt below the top margin, first problem 40pt below the rule
+HEADER_HEIGHT = 100
+QUESTION_INDENT = 30
+QUESTION_TO_VISUAL = 30
+VISUAL_TO_ANSWER = 20
+PROBLEM_GAP = 50
+ANSWER_WIDTH = 150
+
+# Widest visual that fits between the question indent and the right margin on a default page
+MAX_VISUAL_WIDTH = PAGE_WIDTH - 2 * MARGIN - QUESTION_INDENT
+
+# Grouped objects: width per object, and per "+" between two groups
+OBJECT_SPACING = 40
+GROUP_GAP = 60
+
+# Number lines: axis length and label size, and the room ticks and labels need
+NUMBER_LINE_LENGTH = 400
+NUMBER_LINE_FONT_SIZE = 10
+MIN_TICK_SPACING = 4
+MIN_LABEL_GAP = 5
+
+# Helvetica advance widths, per point of font size, of the characters in number labels
+LABEL_CHAR_WIDTHS = {'-': 0.333, '.': 0.278, **{digit: 0.556 for digit in '0123456789'}}
+
+
+def measure_visual(visual_data):
+    """(width, height) of a visual, where height is how far it moves the cursor down"""
+    if not visual_data:
+        return 0, 0
+    visual_type = visual_data.get('type')
+
+    if visual_type == 'countable_objects':
+        count = len(visual_data.get('objects', []))
+        rows = max(1, math.ceil(count / 10))
+        return min(count, 10) * 40, (rows - 1) * 40 + 50
+
+    elif visual_type == 'grouped_objects':
+        groups = visual_data.get('groups', [])
+        width = sum(groups) * OBJECT_SPACING + max(len(groups) - 1, 0) * GROUP_GAP
+        return width, 50
+
+    elif visual_type == 'array':
+        rows = visual_data.get('rows', 3)
+        cols = visual_data.get('cols', 4)
+        return cols * 35, rows * 35 + 20
+
+    elif visual_type == 'number_line':
+        return NUMBER_LINE_LENGTH, 50
+
+    elif visual_type == 'fraction_circle':
+        return 120, 130
+
+    return 0, 0
+
+
+def label_width(text, font_size=NUMBER_LINE_FONT_SIZE):
+    """Width of a number label in Helvetica"""
+    return sum(LABEL_CHAR_WIDTHS.get(char, 0.556) for char in text) * font_size
+
+
+def _nice_steps():
+    """1, 2, 5, 10, 20, 50, 100, ..."""
+    scale = 1
+    while True:
+        for multiple in (1, 2, 5):
+            yield multiple * scale
+        scale *= 10
+
+
+def number_line_ticks(start, end, length=NUMBER_LINE_LENGTH, font_size=NUMBER_LINE_FONT_SIZE):
+    """Ticks of a number line from start to end drawn length points long.
+
+    Returns (major, minor): labeled ticks as (offset, label) pairs and
+    unlabeled tick offsets, in points from the left end. Labels go every
+    major interval, the smallest of 1, 2, 5, 10, 20, ... whose widest labels
+    fit side by side. Minor ticks go every minor interval, the smallest of
+    those dividing the major interval with ticks MIN_TICK_SPACING apart.
+    Either way the tick count is bounded by length, whatever the range.
+
+    A reversed range is drawn ascending; an empty one (start == end) is a
+    single labeled tick in the middle.
+    """
+    lo, hi = min(start, end), max(start, end)
+    if lo == hi:
+        return [(length / 2, str(lo))], []
+    unit = length / (hi - lo)
+    widest = max(label_width(str(lo), font_size), label_width(str(hi), font_size))
+    major = next(step for step in _nice_steps() if step * unit >= widest + MIN_LABEL_GAP)
+    minor = next(step for step in _nice_steps()
+                 if step >= major or (major % step == 0 and step * unit >= MIN_TICK_SPACING))
+
+    labels = [((value - lo) * unit, str(value))
+              for value in range(-(-lo // major) * major, hi + 1, major)]
+    ticks = [] if minor >= major else [(value - lo) * unit
+                                      for value in range(-(-lo // minor) * minor, hi + 1, minor)
+                                      if value % major]
+    return labels, ticks
+
+
+def problem_height(problem):
+    """Distance from a problem's question baseline to its answer line"""
+    _, visual_height = measure_visual(problem.get('visual'))
+    return QUESTION_TO_VISUAL + visual_height + VISUAL_TO_ANSWER
+
+
+def iter_layout(problems, width=PAGE_WIDTH, height=PAGE_HEIGHT, margin=MARGIN):
+    """Yield a box dict per problem, paginating by the space each one needs.
+
+    A problem moves to a new page when its answer line would fall below the
+    bottom margin. A problem taller (or wider) than a page still gets a page to
+    itself and is flagged with overflow=True.
+    """
+    for _, box in iter_placed(problems, width, height, margin):
+        yield box
+
+
+def iter_placed(problems, width=PAGE_WIDTH, height=PAGE_HEIGHT, margin=MARGIN):
+    """Yield (problem, box) pairs as iter_layout places them, consuming problems lazily"""
+    page = 1
+    top = height - margin - HEADER_HEIGHT
+    page_has_problems = False
+    x = margin + QUESTION_INDENT
+
+    for index, problem in enumerate(problems):
+        visual_width, _ = measure_visual(problem.get('visual'))
+        needed = problem_height(problem)
+        if page_has_problems and top - needed < margin:
+            page += 1
+            top = height - margin
+            page_has_problems = False
+
+        answer_y = top - needed
+        box_width = max(visual_width, ANSWER_WIDTH)
+        yield problem, {
+            'number': problem.get('number', index + 1),
+            'page': page,
+            'x': x,
+            'top': top,
+            'answer_y': answer_y,
+            'width': box_width,
+            'height': needed,
+            'overflow': answer_y < margin or x + box_width > width - margin,
+        }
+        top = answer_y - PROBLEM_GAP
+        page_has_problems = True
+
+
+class LayoutPlan:
+    """Pagination and per-problem boxes for one worksheet"""
+
+    def __init__(self, boxes, width=PAGE_WIDTH, height=PAGE_HEIGHT):
+        self.boxes = list(boxes)
+        self.width = width
+        self.height = height
+        self.page_count = self.boxes[-1]['page'] if self.boxes else 1
+
+    @property
+    def pages(self):
+        """Boxes grouped by page (index 0 is page 1)"""
+        pages = [[] for _ in range(self.page_count)]
+        for box in self.boxes:
+            pages[box['page'] - 1].append(box)
+        return pages
+
+    @property
+    def overflow(self):
+        """Numbers of problems that do not fit on a page"""
+        return [box['number'] for box in self.boxes if box['overflow']]
+
+    def to_dict(self):
+        """JSON-serializable form of the plan"""
+        return {
+            'page_count': self.page_count,
+            'page_size': [self.width, self.height],
+            'overflow': self.overflow,
+            'boxes': self.boxes,
+        }
+
+
+def plan_layout(problems, width=PAGE_WIDTH, height=PAGE_HEIGHT, margin=MARGIN):
+    """Lay out problems (dicts with a 'visual' entry) and return a LayoutPlan"""
+    return LayoutPlan(iter_layout(problems, width, height, margin), width, height)
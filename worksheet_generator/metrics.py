@@ -0,0 +1,183 @@
+"""
+Timing and counters for the rendering pipeline.
+"""
+
+import collections
+import contextlib
+import json
+import os
+import time
+from pathlib import Path
+
+
+class RenderMetrics:
+    """Timing and counters for the rendering pipeline, with pluggable callbacks.
+    
+    Callbacks are called as callback(event, payload) where event is 'phase',
+    'problem' or 'object'. Timings are accumulated in seconds and reported
+    in milliseconds. Only the most recent MAX_PROBLEM_ROWS per-problem rows
+    are kept, so a metrics object backing a server stays bounded.
+    """
+
+    BRANCHES = ('openmoji', 'vector', 'circle', 'silhouette', 'culled')
+    MAX_PROBLEM_ROWS = 10000
+
+    def __init__(self, callbacks=None):
+        self.callbacks = list(callbacks or [])
+        self.documents = 0
+        self.pages = 0
+        self.output_bytes = 0
+        self.elided_ops = 0
+        self.phases = {}
+        self.problems = collections.deque(maxlen=self.MAX_PROBLEM_ROWS)
+        self.visual_types = {}
+        self.objects = {}
+        self.branches = dict.fromkeys(self.BRANCHES, 0)
+
+    def _emit(self, event, payload):
+        """Forward an event to every registered callback"""
+        for callback in self.callbacks:
+            callback(event, payload)
+
+    @staticmethod
+    def _add(table, key, seconds, count=1):
+        """Accumulate count and seconds under key, returning the entry"""
+        entry = table.setdefault(key, {'count': 0, 'seconds': 0.0})
+        entry['count'] += count
+        entry['seconds'] += seconds
+        return entry
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Time a named pipeline phase (setup, header, problems, footer, save, ...)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self._add(self.phases, name, elapsed)
+            if self.callbacks:
+                self._emit('phase', {'phase': name, 'seconds': elapsed})
+
+    @contextlib.contextmanager
+    def problem(self, number, visual_type):
+        """Time drawing of a single problem"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            visual_type = visual_type or 'none'
+            self.problems.append({'number': number, 'visual_type': visual_type,
+                                  'ms': round(elapsed * 1000, 3)})
+            self._add(self.visual_types, visual_type, elapsed)
+            if self.callbacks:
+                self._emit('problem', {'number': number, 'visual_type': visual_type,
+                                       'seconds': elapsed})
+
+    def object_drawn(self, object_type, branch, seconds):
+        """Record one drawn object and which fallback branch drew it"""
+        entry = self._add(self.objects, object_type, seconds)
+        entry.setdefault('branches', {})
+        entry['branches'][branch] = entry['branches'].get(branch, 0) + 1
+        self.branches[branch] += 1
+        if self.callbacks:
+            self._emit('object', {'object_type': object_type, 'branch': branch, 'seconds': seconds})
+
+    def document_finished(self, output_bytes=None, pages=0, elided_ops=0):
+        """Count a completed document, its pages, its size in bytes and the state operators dropped"""
+        self.documents += 1
+        self.pages += pages
+        self.output_bytes += output_bytes or 0
+        self.elided_ops += elided_ops or 0
+
+    @staticmethod
+    def _report_table(table):
+        """Convert an accumulator table to rounded millisecond rows"""
+        report = {}
+        for key, entry in sorted(table.items()):
+            row = {'count': entry['count'], 'total_ms': round(entry['seconds'] * 1000, 3)}
+            if 'branches' in entry:
+                row['branches'] = dict(entry['branches'])
+            report[key] = row
+        return report
+
+    def report(self):
+        """JSON-serializable timing report"""
+        return {
+            'documents': self.documents,
+            'pages': self.pages,
+            'output_bytes': self.output_bytes,
+            'elided_ops': self.elided_ops,
+            'total_ms': round(sum(e['seconds'] for e in self.phases.values()) * 1000, 3),
+            'phases': self._report_table(self.phases),
+            'visual_types': self._report_table(self.visual_types),
+            'objects': self._report_table(self.objects),
+            'branches': dict(self.branches),
+            'problems': list(self.problems),
+        }
+
+    def merge(self, report):
+        """Fold a report from another process into these totals (per-problem rows are dropped)"""
+        self.documents += report['documents']
+        self.pages += report.get('pages', 0)
+        self.output_bytes += report.get('output_bytes', 0)
+        self.elided_ops += report.get('elided_ops', 0)
+        for attr in ('phases', 'visual_types', 'objects'):
+            table = getattr(self, attr)
+            for key, row in report[attr].items():
+                entry = self._add(table, key, row['total_ms'] / 1000, row['count'])
+                for branch, count in row.get('branches', {}).items():
+                    entry.setdefault('branches', {})
+                    entry['branches'][branch] = entry['branches'].get(branch, 0) + count
+        for branch, count in report['branches'].items():
+            self.branches[branch] = self.branches.get(branch, 0) + count
+
+    def write_json(self, path):
+        """Write the timing report as JSON"""
+        Path(path).write_text(json.dumps(self.report(), indent=2) + '\n', encoding='utf-8')
+
+    def write_prometheus(self, path, prefix='worksheet_render'):
+        """Write the totals in Prometheus textfile-collector format (atomically)"""
+        lines = [
+            f"# HELP {prefix}_documents_total Documents rendered",
+            f"# TYPE {prefix}_documents_total counter",
+            f"{prefix}_documents_total {self.documents}",
+            f"# HELP {prefix}_pages_total Pages rendered",
+            f"# TYPE {prefix}_pages_total counter",
+            f"{prefix}_pages_total {self.pages}",
+            f"# HELP {prefix}_output_bytes_total Bytes of PDF output produced",
+            f"# TYPE {prefix}_output_bytes_total counter",
+            f"{prefix}_output_bytes_total {self.output_bytes}",
+            f"# HELP {prefix}_elided_ops_total Redundant graphics state operators dropped",
+            f"# TYPE {prefix}_elided_ops_total counter",
+            f"{prefix}_elided_ops_total {self.elided_ops}",
+            f"# HELP {prefix}_phase_seconds_total Time spent per pipeline phase",
+            f"# TYPE {prefix}_phase_seconds_total counter",
+        ]
+        for name, entry in sorted(self.phases.items()):
+            lines.append(f'{prefix}_phase_seconds_total{{phase="{name}"}} {entry["seconds"]:.6f}')
+        lines += [
+            f"# HELP {prefix}_visual_seconds_total Time spent drawing problems per visual type",
+            f"# TYPE {prefix}_visual_seconds_total counter",
+        ]
+        for name, entry in sorted(self.visual_types.items()):
+            lines.append(f'{prefix}_visual_seconds_total{{visual_type="{name}"}} {entry["seconds"]:.6f}')
+        lines += [
+            f"# HELP {prefix}_objects_total Objects drawn per object type and fallback branch",
+            f"# TYPE {prefix}_objects_total counter",
+        ]
+        for name, entry in sorted(self.objects.items()):
+            for branch, count in sorted(entry.get('branches', {}).items()):
+                lines.append(f'{prefix}_objects_total{{object_type="{name}",branch="{branch}"}} {count}')
+        lines += [
+            f"# HELP {prefix}_object_seconds_total Time spent drawing objects per object type",
+            f"# TYPE {prefix}_object_seconds_total counter",
+        ]
+        for name, entry in sorted(self.objects.items()):
+            lines.append(f'{prefix}_object_seconds_total{{object_type="{name}"}} {entry["seconds"]:.6f}')
+
+        path = Path(path)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        os.replace(tmp_path, path)
@@ -0,0 +1,199 @@
+"""
+OpenMoji icon index and parsed-drawing cache.
+"""
+
+import collections
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+from .optional import optional_import
+
+
+class OpenMojiIndex:
+    """In-memory index of the OpenMoji SVGs in a directory.
+    
+    The directory is scanned once; lookups never touch the filesystem. The
+    index can be persisted to a JSON manifest, which is reused as long as the
+    directory's mtime (changed by adding or removing files) is unchanged.
+    """
+
+    _instances = {}
+
+    def __init__(self, directory, manifest_path=None):
+        self.directory = Path(directory)
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+        self.codes = frozenset()
+        self.available = False
+        self.mtime = 0
+        self.source = 'missing'
+        self._load()
+
+    @classmethod
+    def for_directory(cls, directory, manifest_path=None):
+        """Shared index for a directory, built at most once per process"""
+        key = (str(directory), str(manifest_path) if manifest_path else None)
+        index = cls._instances.get(key)
+        if index is None:
+            index = cls._instances[key] = cls(directory, manifest_path)
+        return index
+
+    def _load(self):
+        """Fill the index from a fresh manifest, or scan the directory (and refresh the manifest)"""
+        try:
+            dir_mtime = self.directory.stat().st_mtime
+        except OSError:
+            return
+        self.available = True
+        self.mtime = dir_mtime
+
+        if self.manifest_path is not None:
+            try:
+                manifest = json.loads(self.manifest_path.read_text(encoding='utf-8'))
+                if (manifest.get('directory') == str(self.directory)
+                        and manifest.get('mtime') == dir_mtime):
+                    self.codes = frozenset(manifest['codes'])
+                    self.source = 'manifest'
+                    return
+            except (OSError, ValueError, KeyError):
+                pass
+
+        with os.scandir(self.directory) as entries:
+            self.codes = frozenset(entry.name[:-4] for entry in entries
+                                   if entry.name.endswith('.svg'))
+        self.source = 'scan'
+
+        if self.manifest_path is not None:
+            manifest = {'directory': str(self.directory), 'mtime': dir_mtime,
+                        'codes': sorted(self.codes)}
+            tmp_path = self.manifest_path.with_name(f".{self.manifest_path.name}.{os.getpid()}.tmp")
+            try:
+                tmp_path.write_text(json.dumps(manifest), encoding='utf-8')
+                os.replace(tmp_path, self.manifest_path)
+            except OSError:
+                pass
+
+    def __contains__(self, code):
+        return code in self.codes
+
+    def path(self, code):
+        """Path of the SVG for code (only meaningful when code is in the index)"""
+        return self.directory / f"{code}.svg"
+
+
+class OpenMojiDrawingCache:
+    """LRU cache of parsed OpenMoji drawings scaled to an icon size.
+    
+    Entries are keyed by icon directory, code and size. Each SVG is parsed
+    once per directory: its pickled drawing is kept as an entry of its own and
+    unpickled into a fresh copy for every size. Bounded by entry count and
+    (pickled) bytes. With disk_dir set, each parsed SVG is also stored there
+    as a pickled reportlab Drawing so warm processes skip XML parsing
+    entirely; entries are keyed by the icon directory and its mtime. Only
+    point disk_dir at a trusted, private location.
+    """
+
+    def __init__(self, max_items=256, max_bytes=32 * 1024 * 1024, disk_dir=None):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.entries = collections.OrderedDict()
+        self.total_bytes = 0
+        self.failed = set()
+        self.hits = 0
+        self.misses = 0
+        self.parses = 0
+        self.disk_hits = 0
+
+    def _disk_path(self, index, code):
+        directory = hashlib.sha256(str(index.directory).encode('utf-8')).hexdigest()[:16]
+        return self.disk_dir / f"{code}-{directory}-{int(index.mtime)}.rlg.pickle"
+
+    def _load_base(self, index, code):
+        """Parsed drawing for code and its pickle, from the pre-converted store or by parsing the SVG"""
+        disk_path = self._disk_path(index, code) if self.disk_dir else None
+        if disk_path is not None:
+            try:
+                data = disk_path.read_bytes()
+                drawing = pickle.loads(data)
+                self.disk_hits += 1
+                return drawing, data
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+
+        svglib = optional_import('svglib.svglib')
+        if svglib is None:
+            return None, None
+        drawing = svglib.svg2rlg(str(index.path(code)))
+        if drawing is None:
+            return None, None
+        self.parses += 1
+        data = pickle.dumps(drawing, protocol=pickle.HIGHEST_PROTOCOL)
+
+        if disk_path is not None:
+            try:
+                self.disk_dir.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, prefix='.tmp-')
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, disk_path)
+            except OSError:
+                pass
+        return drawing, data
+
+    def _put(self, key, value, nbytes):
+        self.entries[key] = (value, nbytes)
+        self.total_bytes += nbytes
+        while self.entries and (len(self.entries) > self.max_items
+                                or self.total_bytes > self.max_bytes):
+            _, (_, evicted_bytes) = self.entries.popitem(last=False)
+            self.total_bytes -= evicted_bytes
+
+    def get(self, index, code, size):
+        """Drawing for code scaled to span 2 * size points, or None if it cannot be rendered"""
+        directory = str(index.directory)
+        key = (directory, code, size)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        if (directory, code) in self.failed:
+            return None
+
+        self.misses += 1
+        # The parsed drawing, shared by every size of the icon
+        base_key = (directory, code, None)
+        base = self.entries.get(base_key)
+        if base is not None:
+            self.entries.move_to_end(base_key)
+            data = base[0]
+            drawing = pickle.loads(data)
+        else:
+            try:
+                drawing, data = self._load_base(index, code)
+            except Exception:
+                drawing = None
+            if drawing is None:
+                self.failed.add((directory, code))
+                return None
+            self._put(base_key, data, len(data))
+
+        scale = 2 * size / max(drawing.width, drawing.height)
+        drawing.scale(scale, scale)
+        drawing.width *= scale
+        drawing.height *= scale
+        self._put(key, drawing, len(data))
+        return drawing
+
+    def stats(self):
+        """Return cache counters for reporting"""
+        return {'entries': len(self.entries), 'bytes': self.total_bytes, 'hits': self.hits,
+                'misses': self.misses, 'parses': self.parses, 'disk_hits': self.disk_hits}
+
+
+# Parsed OpenMoji drawings shared by every generator in the process
+openmoji_drawings = OpenMojiDrawingCache()
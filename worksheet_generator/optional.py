@@ -0,0 +1,24 @@
+"""
+Optional dependencies (numpy, svglib, PyMuPDF), imported on first use.
+"""
+
+import importlib
+
+# Module name -> module, or False when the import failed
+_modules = {}
+
+
+def optional_import(name):
+    """Return the module called name, or None when it is not installed.
+
+    The import is attempted once per process; later calls return the
+    remembered result.
+    """
+    module = _modules.get(name)
+    if module is None:
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            module = False
+        _modules[name] = module
+    return module or None
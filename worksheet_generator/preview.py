@@ -0,0 +1,196 @@
+"""
+Page previews: rasterize one worksheet page to PNG.
+
+Backends, in the order 'auto' tries them:
+  pymupdf  - rasterizes a one-page PDF with PyMuPDF (optional, exact)
+  pdftoppm - rasterizes a one-page PDF with poppler's pdftoppm (if on PATH, exact)
+  pillow   - draws the page straight onto a Pillow image through PillowCanvas;
+             no PDF is produced, OpenMoji icons use their vector fallbacks
+"""
+
+import io
+import os
+import shutil
+import subprocess
+import tempfile
+
+from .backends import CanvasBackend
+from .optional import optional_import
+
+def available_backends():
+    """Raster backends usable in this environment, in order of preference"""
+    backends = []
+    if optional_import('fitz') is not None:
+        backends.append('pymupdf')
+    if shutil.which('pdftoppm'):
+        backends.append('pdftoppm')
+    backends.append('pillow')
+    return backends
+
+
+def choose_backend(backend='auto'):
+    """Resolve 'auto' to the best available backend, or check that backend is usable"""
+    backends = available_backends()
+    if backend == 'auto':
+        return backends[0]
+    if backend not in backends:
+        raise ValueError(f"Preview backend {backend!r} is not available (have: {', '.join(backends)})")
+    return backend
+
+
+def rasterize_pdf(pdf, dpi, backend):
+    """PNG bytes of the first page of a PDF with a PDF-reading backend"""
+    if backend == 'pymupdf':
+        document = optional_import('fitz').open(stream=bytes(pdf), filetype='pdf')
+        try:
+            return document[0].get_pixmap(dpi=dpi).tobytes('png')
+        finally:
+            document.close()
+
+    with tempfile.TemporaryDirectory(prefix='worksheet-preview-') as tmp:
+        pdf_path = os.path.join(tmp, 'page.pdf')
+        with open(pdf_path, 'wb') as f:
+            f.write(pdf)
+        subprocess.run(['pdftoppm', '-png', '-r', str(dpi), '-singlefile', pdf_path,
+                        os.path.join(tmp, 'page')], check=True, capture_output=True)
+        with open(os.path.join(tmp, 'page.png'), 'rb') as f:
+            return f.read()
+
+
+class PillowCanvas(CanvasBackend):
+    """Draws the generator's canvas calls onto a Pillow image.
+
+    Only the first page is kept. Drawing happens at supersample times the
+    requested resolution and is downsampled on save for smooth edges.
+    """
+
+    FONT_FILES = {
+        'Helvetica': 'DejaVuSans.ttf',
+        'Helvetica-Bold': 'DejaVuSans-Bold.ttf',
+        'Helvetica-Oblique': 'DejaVuSans-Oblique.ttf',
+    }
+
+    # Straight segments per Bezier curve when flattening paths
+    CURVE_STEPS = 12
+
+    def __init__(self, pagesize, dpi=72, supersample=2):
+        from PIL import Image, ImageDraw
+
+        super().__init__(pagesize)
+        self.dpi = dpi
+        self.supersample = supersample
+        self.scale = dpi / 72 * supersample
+        self.image = Image.new('RGB', (round(self.page_width * self.scale),
+                                       round(self.page_height * self.scale)), 'white')
+        self.draw = ImageDraw.Draw(self.image)
+        self._fonts = {}
+
+    # Coordinates and state
+
+    def _xy(self, x, y):
+        ox, oy = self._origin
+        return ((x + ox) * self.scale, (self.page_height - y - oy) * self.scale)
+
+    @staticmethod
+    def _rgb(color):
+        return tuple(round(channel * 255) for channel in color)
+
+    def _stroke_width(self):
+        return max(1, round(self._line_width * self.scale))
+
+    def _pil_font(self):
+        from PIL import ImageFont
+
+        font = self._fonts.get(self._font)
+        if font is None:
+            name, size = self._font
+            pixels = max(1, round(size * self.scale))
+            try:
+                font = ImageFont.truetype(self.FONT_FILES.get(name, 'DejaVuSans.ttf'), pixels)
+            except OSError:
+                font = ImageFont.load_default(size=pixels)
+            self._fonts[self._font] = font
+        return font
+
+    def _polylines(self, path):
+        """Flatten a BackendPath into point lists in image coordinates"""
+        polylines = []
+        for segment in path.segments:
+            op = segment[0]
+            if op == 'M':
+                polylines.append([segment[1:]])
+            elif op == 'L':
+                polylines[-1].append(segment[1:])
+            elif op == 'C':
+                x0, y0 = polylines[-1][-1]
+                x1, y1, x2, y2, x3, y3 = segment[1:]
+                for i in range(1, self.CURVE_STEPS + 1):
+                    t = i / self.CURVE_STEPS
+                    u = 1 - t
+                    polylines[-1].append((
+                        u ** 3 * x0 + 3 * u * u * t * x1 + 3 * u * t * t * x2 + t ** 3 * x3,
+                        u ** 3 * y0 + 3 * u * u * t * y1 + 3 * u * t * t * y2 + t ** 3 * y3,
+                    ))
+            elif op == 'Z' and polylines and len(polylines[-1]) > 1:
+                polylines[-1].append(polylines[-1][0])
+        return [[self._xy(x, y) for x, y in points] for points in polylines]
+
+    # Shapes and text (only page 1 is drawn)
+
+    def _drawing(self):
+        return self.page == 1
+
+    def circle(self, x, y, r, fill=0, stroke=1):
+        self.ellipse(x - r, y - r, x + r, y + r, fill, stroke)
+
+    def ellipse(self, x1, y1, x2, y2, fill=0, stroke=1):
+        if not self._drawing():
+            return
+        (ax, ay), (bx, by) = self._xy(x1, y1), self._xy(x2, y2)
+        box = [min(ax, bx), min(ay, by), max(ax, bx), max(ay, by)]
+        self.draw.ellipse(box, fill=self._rgb(self._fill) if fill else None,
+                          outline=self._rgb(self._stroke) if stroke else None,
+                          width=self._stroke_width() if stroke else 0)
+
+    def rect(self, x, y, width, height, fill=0, stroke=1):
+        if not self._drawing():
+            return
+        (ax, ay), (bx, by) = self._xy(x, y), self._xy(x + width, y + height)
+        box = [min(ax, bx), min(ay, by), max(ax, bx), max(ay, by)]
+        self.draw.rectangle(box, fill=self._rgb(self._fill) if fill else None,
+                            outline=self._rgb(self._stroke) if stroke else None,
+                            width=self._stroke_width() if stroke else 0)
+
+    def line(self, x1, y1, x2, y2):
+        if self._drawing():
+            self.draw.line([self._xy(x1, y1), self._xy(x2, y2)], fill=self._rgb(self._stroke),
+                           width=self._stroke_width())
+
+    def drawPath(self, path, fill=0, stroke=1):
+        if not self._drawing():
+            return
+        for points in self._polylines(path):
+            if fill and len(points) > 2:
+                self.draw.polygon(points, fill=self._rgb(self._fill))
+            if stroke and len(points) > 1:
+                self.draw.line(points, fill=self._rgb(self._stroke), width=self._stroke_width(),
+                               joint='curve')
+
+    def drawString(self, x, y, text):
+        if self._drawing():
+            self.draw.text(self._xy(x, y), text, font=self._pil_font(), fill=self._rgb(self._fill),
+                           anchor='ls')
+
+    def drawCentredString(self, x, y, text):
+        if self._drawing():
+            self.draw.text(self._xy(x, y), text, font=self._pil_font(), fill=self._rgb(self._fill),
+                           anchor='ms')
+
+    def png(self):
+        """PNG bytes of the first page at the requested resolution"""
+        # Box-filter reduction is exact for an integer supersample factor and much
+        # cheaper than a resampling filter; optimize=True would triple encode time
+        image = self.image.reduce(self.supersample) if self.supersample > 1 else self.image
+        buffer = io.BytesIO()
+        image.save(buffer, 'PNG', dpi=(self.dpi, self.dpi), compress_level=6)
+        return buffer.getvalue()
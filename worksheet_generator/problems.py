@@ -0,0 +1,262 @@
+"""
+Seeded procedural problem generation.
+
+Operand tuples are sampled and de-duplicated in batches. NumPy is used when
+it is installed; otherwise a pure-Python sampler produces the same kind of
+problem sets. A seed is reproducible per backend, and the backend is chosen
+with the spec's 'backend' key ('auto', 'numpy' or 'python').
+"""
+
+import itertools
+import random
+
+from .layout import GROUP_GAP, MAX_VISUAL_WIDTH, OBJECT_SPACING
+from .optional import optional_import
+from .registry import THEME_OBJECTS
+
+# Operand ranges per grade when a spec gives no 'min'/'max'
+GRADE_RANGES = {1: (1, 5), 2: (1, 10), 3: (2, 10), 4: (2, 12), 5: (2, 12)}
+
+# Per operation: operand ranges derived from (lo, hi), and an optional ordering
+# constraint (i, j, strict) meaning operand i < operand j (or <= when not strict)
+OPERATIONS = {
+    'addition': {'ranges': lambda lo, hi: [(lo, hi), (lo, hi)], 'order': None},
+    'subtraction': {'ranges': lambda lo, hi: [(lo, hi), (lo, hi)], 'order': (1, 0, False)},
+    'multiplication': {'ranges': lambda lo, hi: [(lo, hi), (lo, hi)], 'order': None},
+    'number_line': {'ranges': lambda lo, hi: [(lo, hi), (lo, hi)], 'order': None},
+    'fraction': {'ranges': lambda lo, hi: [(1, max(hi, 3) - 1), (2, max(hi, 3))], 'order': (0, 1, True)},
+}
+
+# Most objects a two-group grouped_objects row holds without the layout flagging it as overflowing
+MAX_GROUPED_OBJECTS = int((MAX_VISUAL_WIDTH - GROUP_GAP) // OBJECT_SPACING)
+
+
+class Problem:
+    """One numbered worksheet problem: question text, answer text and optional visual_data.
+
+    Slotted, because practice packets hold many thousands of these. get() and
+    item access mirror the dict form used by specs, so layout code can take
+    either.
+    """
+
+    __slots__ = ('number', 'question', 'answer', 'visual')
+
+    def __init__(self, number, question, answer, visual=None):
+        self.number = number
+        self.question = question
+        self.answer = answer
+        self.visual = visual
+
+    @classmethod
+    def coerce(cls, item, number):
+        """Problem from a Problem, a spec dict or a (question, answer[, visual]) tuple"""
+        if isinstance(item, cls):
+            return item if item.number == number else cls(number, item.question, item.answer, item.visual)
+        if isinstance(item, dict):
+            return cls(number, item['question'], item['answer'], item.get('visual'))
+        return cls(number, *item)
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def to_dict(self):
+        return {'number': self.number, 'question': self.question, 'answer': self.answer,
+                'visual': self.visual}
+
+    def __repr__(self):
+        return f"Problem({self.number!r}, {self.question!r}, {self.answer!r}, {self.visual!r})"
+
+
+def _in_order(row, order):
+    i, j, strict = order
+    return row[i] < row[j] if strict else row[i] <= row[j]
+
+
+def _space_size(ranges, order):
+    """Number of distinct operand tuples satisfying the ordering constraint"""
+    total = 1
+    for lo, hi in ranges:
+        total *= max(hi - lo + 1, 0)
+    if order is None:
+        return total
+    i, j, strict = order
+    (lo_i, hi_i), (lo_j, hi_j) = ranges[i], ranges[j]
+    pairs = sum(max(min(hi_i, v - 1 if strict else v) - lo_i + 1, 0) for v in range(lo_j, hi_j + 1))
+    return total // ((hi_i - lo_i + 1) * (hi_j - lo_j + 1)) * pairs
+
+
+def _sample_python(seed, ranges, order, count, unique):
+    """Sample operand tuples with the random module"""
+    rng = random.Random(seed)
+    if unique and count * 2 > _space_size(ranges, order):
+        # Dense request: enumerate the valid space and draw without replacement
+        space = [row for row in itertools.product(*(range(lo, hi + 1) for lo, hi in ranges))
+                 if order is None or _in_order(row, order)]
+        return rng.sample(space, count), rng
+
+    randint = rng.randint
+    rows = []
+    seen = set()
+    while len(rows) < count:
+        batch = [tuple(randint(lo, hi) for lo, hi in ranges) for _ in range(max(64, 2 * (count - len(rows))))]
+        if order is not None:
+            batch = [row for row in batch if _in_order(row, order)]
+        if unique:
+            batch = [row for row in batch if not (row in seen or seen.add(row))]
+        rows.extend(batch)
+    return rows[:count], rng
+
+
+def _sample_numpy(np, seed, ranges, order, count, unique):
+    """Sample operand tuples in vectorized batches"""
+    rng = np.random.default_rng(seed)
+    lows = np.array([lo for lo, hi in ranges], dtype=np.int64)
+    highs = np.array([hi for lo, hi in ranges], dtype=np.int64)
+
+    def ordered(batch):
+        if order is None:
+            return batch
+        i, j, strict = order
+        mask = batch[:, i] < batch[:, j] if strict else batch[:, i] <= batch[:, j]
+        return batch[mask]
+
+    if unique and count * 2 > _space_size(ranges, order):
+        grid = np.indices(tuple(highs - lows + 1)).reshape(len(ranges), -1).T + lows
+        space = ordered(grid)
+        return space[rng.permutation(len(space))[:count]].tolist(), rng
+
+    # Mixed-radix key identifies a tuple for de-duplication
+    strides = np.cumprod(np.concatenate(([1], (highs - lows + 1)[:-1])))
+    rows = np.empty((0, len(ranges)), dtype=np.int64)
+    seen = np.empty(0, dtype=np.int64)
+    while len(rows) < count:
+        batch = ordered(rng.integers(lows, highs + 1, size=(max(64, 2 * (count - len(rows))), len(ranges))))
+        if unique:
+            keys = (batch - lows) @ strides
+            _, first = np.unique(keys, return_index=True)
+            first.sort()
+            batch, keys = batch[first], keys[first]
+            fresh = ~np.isin(keys, seen)
+            batch = batch[fresh]
+            seen = np.concatenate((seen, keys[fresh]))
+        rows = np.concatenate((rows, batch))
+    return rows[:count].tolist(), rng
+
+
+def _pick_objects(rng, objects, count):
+    """Object type for each problem, drawn from the sampler's generator"""
+    if hasattr(rng, 'integers'):
+        return [objects[i] for i in rng.integers(0, len(objects), size=count).tolist()]
+    return [rng.choice(objects) for _ in range(count)]
+
+
+def _addition(a, b, object_type, line_end):
+    if a + b > MAX_GROUPED_OBJECTS:
+        return _number_line(a, b, object_type, line_end)
+    return (f"Add the groups: {a} + {b} = ___", f"{a} + {b} = {a + b}",
+            {'type': 'grouped_objects', 'object_type': object_type, 'groups': [a, b]})
+
+
+def _subtraction(a, b, object_type, line_end):
+    return (f"Take away {b}: {a} - {b} = ___", f"{a} - {b} = {a - b}",
+            {'type': 'countable_objects', 'object_type': object_type, 'objects': list(range(a))})
+
+
+def _multiplication(a, b, object_type, line_end):
+    return ("How many in the array? ___ × ___ = ___", f"{a} × {b} = {a * b}",
+            {'type': 'array', 'object_type': object_type, 'rows': a, 'cols': b})
+
+
+def _number_line(a, b, object_type, line_end):
+    return (f"Use the number line: {a} + {b} = ___", f"{a} + {b} = {a + b}",
+            {'type': 'number_line', 'start': 0, 'end': line_end})
+
+
+def _fraction(a, b, object_type, line_end):
+    return ("What fraction of the circle is shaded?", f"{a}/{b}",
+            {'type': 'fraction_circle', 'total_parts': b, 'shaded_parts': a})
+
+
+_FORMATTERS = {
+    'addition': _addition,
+    'subtraction': _subtraction,
+    'multiplication': _multiplication,
+    'number_line': _number_line,
+    'fraction': _fraction,
+}
+
+
+def generate_problems(spec):
+    """Build a problem set from a generation spec.
+
+    Spec keys: operation (required), count, seed, grade, min, max, theme,
+    object_type, unique and backend. Returns a list of
+    {'question', 'answer', 'visual'} dicts, the same shape as the
+    'problems' entries of a worksheet spec.
+    """
+    return list(iter_generated_problems(spec))
+
+
+def iter_generated_problems(spec):
+    """generate_problems as a generator: operands are sampled up front (they are
+    de-duplicated as a batch), problem dicts are built as they are consumed"""
+    operation = spec.get('operation')
+    if operation not in OPERATIONS:
+        raise ValueError(f"Unknown operation {operation!r}; expected one of {', '.join(OPERATIONS)}")
+    count = int(spec.get('count', 10))
+    unique = spec.get('unique', True)
+    default_lo, default_hi = GRADE_RANGES.get(spec.get('grade', 1), GRADE_RANGES[5])
+    lo, hi = int(spec.get('min', default_lo)), int(spec.get('max', default_hi))
+    if lo > hi:
+        raise ValueError(f"Operand range is empty: min={lo} > max={hi}")
+
+    ranges = OPERATIONS[operation]['ranges'](lo, hi)
+    order = OPERATIONS[operation]['order']
+    available = _space_size(ranges, order)
+    if unique and count > available:
+        raise ValueError(f"Only {available} distinct {operation} problems exist for range {lo}..{hi}; "
+                         f"asked for {count}")
+
+    backend = spec.get('backend', 'auto')
+    np = optional_import('numpy') if backend in ('auto', 'numpy') else None
+    if backend == 'numpy' and np is None:
+        raise ImportError("backend 'numpy' requested but numpy is not installed")
+    if np is not None:
+        rows, rng = _sample_numpy(np, spec.get('seed'), ranges, order, count, unique)
+    else:
+        rows, rng = _sample_python(spec.get('seed'), ranges, order, count, unique)
+
+    if spec.get('object_type'):
+        object_types = [spec['object_type']] * count
+    else:
+        objects = THEME_OBJECTS.get(spec.get('theme', 'default'), THEME_OBJECTS['default'])
+        object_types = _pick_objects(rng, objects, count)
+
+    format_problem = _FORMATTERS[operation]
+    line_end = 2 * hi
+    for (a, b), object_type in zip(rows, object_types):
+        question, answer, visual = format_problem(a, b, object_type, line_end)
+        yield {'question': question, 'answer': answer, 'visual': visual}
+
+
+def spec_problems(spec):
+    """Every problem of a worksheet spec: its fixed 'problems' then its 'generate' sets.
+
+    Generation specs inherit the worksheet's grade and theme.
+    """
+    return list(iter_spec_problems(spec))
+
+
+def iter_spec_problems(spec):
+    """spec_problems as a generator, one generation set at a time"""
+    yield from spec.get('problems', [])
+    generate = spec.get('generate') or []
+    for generate_spec in ([generate] if isinstance(generate, dict) else generate):
+        generate_spec = {'grade': spec.get('grade', 1), 'theme': spec.get('theme', 'default'),
+                         **generate_spec}
+        yield from iter_generated_problems(generate_spec)
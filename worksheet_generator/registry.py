@@ -0,0 +1,65 @@
+"""
+Static object and theme metadata.
+Importing this module is cheap: no reportlab and no drawing code.
+"""
+
+# Part of every output cache key; bump whenever rendered output changes
+GENERATOR_VERSION = '1.7'
+
+# Every drawable object: category and the VectorGraphicsLibrary method that draws it
+OBJECT_REGISTRY = {
+    'apple': {'category': 'food', 'draw': 'draw_apple'},
+    'banana': {'category': 'food', 'draw': 'draw_banana'},
+    'orange': {'category': 'food', 'draw': 'draw_orange'},
+    'strawberry': {'category': 'food', 'draw': 'draw_strawberry'},
+    'cookie': {'category': 'food', 'draw': 'draw_cookie'},
+    'pizza': {'category': 'food', 'draw': 'draw_pizza'},
+    'carrot': {'category': 'food', 'draw': 'draw_carrot'},
+    'dog': {'category': 'animals', 'draw': 'draw_dog'},
+    'cat': {'category': 'animals', 'draw': 'draw_cat'},
+    'rabbit': {'category': 'animals', 'draw': 'draw_rabbit'},
+    'bear': {'category': 'animals', 'draw': 'draw_bear'},
+    'fish': {'category': 'animals', 'draw': 'draw_fish'},
+    'butterfly': {'category': 'nature', 'draw': 'draw_butterfly'},
+    'bee': {'category': 'nature', 'draw': 'draw_bee'},
+    'star': {'category': 'space', 'draw': 'draw_star'},
+    'starfish': {'category': 'animals', 'draw': 'draw_star'},
+    'sun': {'category': 'space', 'draw': 'draw_sun'},
+    'moon': {'category': 'space', 'draw': 'draw_moon'},
+    'rocket': {'category': 'space', 'draw': 'draw_rocket'},
+    'car': {'category': 'other', 'draw': 'draw_car'},
+    'tree': {'category': 'nature', 'draw': 'draw_tree'},
+    'flower': {'category': 'nature', 'draw': 'draw_flower'},
+    'heart': {'category': 'other', 'draw': 'draw_heart'},
+    'circle': {'category': 'shapes', 'draw': 'draw_circle'},
+    'square': {'category': 'shapes', 'draw': 'draw_square'},
+    'triangle': {'category': 'shapes', 'draw': 'draw_triangle'},
+    'book': {'category': 'other', 'draw': 'draw_book'},
+    'pencil': {'category': 'other', 'draw': 'draw_pencil'},
+}
+
+# OpenMoji code mapping (for if OpenMoji is available)
+OPENMOJI_CODES = {
+    'apple': '1F34E', 'banana': '1F34C', 'orange': '1F34A',
+    'strawberry': '1F353', 'cookie': '1F36A', 'pizza': '1F355',
+    'dog': '1F436', 'cat': '1F431', 'rabbit': '1F430',
+    'bear': '1F43B', 'fish': '1F41F', 'butterfly': '1F98B',
+    # ... add more as needed
+}
+
+# Objects each theme draws, used to warm caches before serving requests
+THEME_OBJECTS = {
+    'food': ['apple', 'banana', 'orange', 'strawberry', 'cookie', 'pizza', 'carrot'],
+    'animals': ['dog', 'cat', 'rabbit', 'bear', 'fish', 'butterfly', 'bee'],
+    'nature': ['tree', 'flower', 'butterfly', 'bee', 'sun'],
+    'space': ['star', 'sun', 'moon', 'rocket'],
+    'shapes': ['circle', 'square', 'triangle', 'heart'],
+    'school': ['book', 'pencil'],
+    'mixed': ['fish', 'star', 'butterfly', 'heart'],
+    'default': ['circle'],
+}
+
+
+def list_available_objects():
+    """Sorted names of every drawable object"""
+    return sorted(OBJECT_REGISTRY)
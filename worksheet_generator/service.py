@@ -0,0 +1,461 @@
+"""
+Batch manifest rendering and the warm JSON-RPC render server.
+"""
+
+import base64
+import json
+import multiprocessing
+import os
+import socketserver
+import sys
+import time
+from pathlib import Path
+
+from .caches import OutputCache, PageCache
+from .classset import ClassSet
+from .generator import HybridWorksheetGenerator
+from .layout import plan_layout
+from .metrics import RenderMetrics
+from .openmoji import openmoji_drawings
+from .problems import iter_spec_problems, spec_problems
+from .registry import THEME_OBJECTS
+from .vector import get_display_list
+
+
+# Output cache, profiling and compact-output switches shared by every job in a batch worker
+_batch_cache = None
+_batch_profile = False
+_batch_compact = False
+
+
+def _init_batch_worker(cache_dir=None, cache_max_bytes=None, profile=False,
+                       openmoji_cache_dir=None, compact=False):
+    """Pool initializer: keep worker chatter off the result stream and open the caches"""
+    global _batch_cache, _batch_profile, _batch_compact
+    sys.stdout = sys.stderr
+    if cache_dir:
+        _batch_cache = OutputCache(cache_dir, cache_max_bytes)
+    if openmoji_cache_dir:
+        openmoji_drawings.disk_dir = Path(openmoji_cache_dir)
+    _batch_profile = profile
+    _batch_compact = compact
+
+
+def _size_report(generators):
+    """Total bytes and dropped state operators for generators, with written page-stream sizes per kind"""
+    sizes = [(kind, size) for gen in generators for kind, size in gen.output_sizes.items()]
+    report = {'bytes': sum(size['bytes'] or 0 for _, size in sizes),
+              'elided_ops': sum(size['elided_ops'] or 0 for _, size in sizes)}
+    page_bytes = {}
+    for kind, size in sizes:
+        if size['page_bytes']:
+            page_bytes.setdefault(kind, []).extend(size['page_bytes'])
+    if page_bytes:
+        report['page_bytes'] = page_bytes
+    return report
+
+
+def _write_preview(gen, spec):
+    """Write the PNG preview a job asks for ('preview', 'preview_page', 'preview_dpi')"""
+    png = gen.render_preview(spec.get('preview_page', 1), spec.get('preview_dpi', 72),
+                             spec.get('preview_backend', 'auto'))
+    HybridWorksheetGenerator._write_output(spec['preview'], png)
+    return {'preview': spec['preview'], 'preview_bytes': len(png),
+            'preview_cached': gen.served_from_cache}
+
+
+def _write_markup(gen, spec):
+    """Write the SVG page ('svg', 'svg_page') and/or HTML document ('html') a job asks for"""
+    result = {}
+    if spec.get('svg'):
+        svg = gen.render_svg(spec.get('svg_page', 1)).encode('utf-8')
+        HybridWorksheetGenerator._write_output(spec['svg'], svg)
+        result.update({'svg': spec['svg'], 'svg_bytes': len(svg)})
+    if spec.get('html'):
+        html = gen.render_html().encode('utf-8')
+        HybridWorksheetGenerator._write_output(spec['html'], html)
+        result.update({'html': spec['html'], 'html_bytes': len(html)})
+    return result
+
+
+def _write_views(gen, spec):
+    """Write every non-PDF output a job asks for"""
+    result = _write_markup(gen, spec)
+    if spec.get('preview'):
+        result.update(_write_preview(gen, spec))
+    return result
+
+
+def _render_views(spec, metrics):
+    """Render a manifest job that writes no PDF (only previews, SVG or HTML)"""
+    gen = HybridWorksheetGenerator.from_spec(spec, quiet=True, cache=_batch_cache, metrics=metrics)
+    return _write_views(gen, spec)
+
+
+def _render_class_set(spec, metrics):
+    """Render a manifest job whose 'class_set' entry asks for per-student variants"""
+    options = spec['class_set']
+    options = options if isinstance(options, dict) else {'variants': options}
+    class_set = ClassSet(spec, variants=options.get('variants'), seeds=options.get('seeds'),
+                         students=options.get('students'), quiet=True, cache=_batch_cache,
+                         metrics=metrics)
+    result = {'variants': len(class_set), 'output': spec['output']}
+    if options.get('merged', True):
+        result['icon_cache'] = class_set.generate_merged(spec['output'], spec.get('answer_key'))
+        result['cached'] = class_set.generators[0].served_from_cache
+    else:
+        result['outputs'] = class_set.generate_individual(spec['output'], spec.get('answer_key'))
+    if spec.get('answer_key'):
+        result['answer_key'] = spec['answer_key']
+    result.update(_size_report(class_set.generators))
+    return result
+
+
+def render_job(job):
+    """Render one manifest job and return a JSON-serializable result"""
+    line_no, spec = job
+    started = time.perf_counter()
+    result = {'line': line_no, 'id': line_no}
+    try:
+        if not isinstance(spec, dict):
+            raise ValueError(spec)
+        result['id'] = spec.get('id', line_no)
+        if not any(spec.get(key) for key in ('output', 'preview', 'svg', 'html')):
+            raise ValueError("job is missing 'output' (or 'preview', 'svg', 'html')")
+        metrics = RenderMetrics() if _batch_profile else None
+        if _batch_compact:
+            spec = {'compact': True, **spec}
+        if spec.get('class_set'):
+            result.update(_render_class_set(spec, metrics))
+        elif not spec.get('output'):
+            result.update(_render_views(spec, metrics))
+        else:
+            gen = HybridWorksheetGenerator.from_spec(spec, quiet=True, cache=_batch_cache,
+                                                     metrics=metrics, stream=spec.get('stream', False))
+            if spec.get('stream'):
+                result['icon_cache'] = gen.generate_stream(iter_spec_problems(spec), spec['output'],
+                                                           spec.get('answer_key'))
+                if spec.get('answer_key'):
+                    result['answer_key'] = spec['answer_key']
+            elif spec.get('combined'):
+                result['icon_cache'] = gen.generate_with_answer_key(spec['output'], combined=True)
+            elif spec.get('answer_key'):
+                result['icon_cache'] = gen.generate_with_answer_key(spec['output'], spec['answer_key'])
+                result['answer_key'] = spec['answer_key']
+            else:
+                result['icon_cache'] = gen.generate_worksheet()
+            result['output'] = spec['output']
+            result['cached'] = gen.served_from_cache
+            if gen.culled:
+                result['culled'] = gen.culled
+            result.update(_size_report([gen]))
+            if not spec.get('stream'):
+                # A streamed generator holds no problems to draw views from
+                result.update(_write_views(gen, spec))
+        if metrics is not None:
+            result['metrics'] = metrics.report()
+        result['status'] = 'ok'
+    except Exception as e:
+        result['status'] = 'error'
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['seconds'] = round(time.perf_counter() - started, 4)
+    return result
+
+
+def read_manifest(manifest_path):
+    """Yield (line number, spec) pairs from a JSONL manifest, skipping blank lines"""
+    with open(manifest_path, encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                yield line_no, json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_no, f"invalid JSON: {e}"
+
+
+def run_batch(manifest_path, workers=None, chunksize=1, out=None,
+              cache_dir=None, cache_max_bytes=None, metrics=None, openmoji_cache_dir=None,
+              compact=False):
+    """Render every job in a manifest across a process pool, streaming results as JSON lines.
+    
+    When metrics is given, workers profile each job and the reports are merged into it.
+    """
+    out = out or sys.stdout
+    workers = workers or os.cpu_count() or 1
+    totals = {'ok': 0, 'error': 0, 'bytes': 0}
+    started = time.perf_counter()
+
+    with multiprocessing.Pool(workers, initializer=_init_batch_worker,
+                              initargs=(cache_dir, cache_max_bytes, metrics is not None,
+                                        openmoji_cache_dir, compact)) as pool:
+        for result in pool.imap_unordered(render_job, read_manifest(manifest_path), chunksize):
+            totals[result['status']] += 1
+            totals['bytes'] += result.get('bytes') or 0
+            if 'metrics' in result:
+                report = result.pop('metrics')
+                metrics.merge(report)
+                result['render_ms'] = report['total_ms']
+            out.write(json.dumps(result) + '\n')
+            out.flush()
+
+    elapsed = time.perf_counter() - started
+    print(f"✅ Batch finished: {totals['ok']} ok, {totals['error']} failed "
+          f"in {elapsed:.2f}s on {workers} workers ({totals['bytes']:,} bytes)", file=sys.stderr)
+    return totals
+
+
+def watch_spec(spec_path, interval=0.25, compact=False, page_cache=None, once=False):
+    """Re-render a JSON worksheet spec whenever the file changes, redrawing only changed pages.
+
+    The spec's 'output' (and 'answer_key', if given) are rewritten after each
+    change. Runs until interrupted, or for a single render with once=True.
+    """
+    page_cache = page_cache or PageCache()
+    path = Path(spec_path)
+    seen = None
+    while True:
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if mtime is not None and mtime != seen:
+            seen = mtime
+            started = time.perf_counter()
+            try:
+                spec = json.loads(path.read_text(encoding='utf-8'))
+                if not spec.get('output'):
+                    raise ValueError("spec is missing 'output'")
+                if compact:
+                    spec = {'compact': True, **spec}
+                gen = HybridWorksheetGenerator.from_spec(spec, quiet=True, page_cache=page_cache)
+                gen.generate_worksheet()
+                pages = gen.page_stats
+                if spec.get('answer_key'):
+                    gen.generate_answer_key(spec['answer_key'])
+            except Exception as e:
+                print(f"❌ {spec_path}: {type(e).__name__}: {e}", file=sys.stderr)
+            else:
+                elapsed = (time.perf_counter() - started) * 1000
+                print(f"🔁 {spec['output']} regenerated in {elapsed:.1f}ms "
+                      f"({pages['reused']} pages reused, {pages['drawn']} drawn)", file=sys.stderr)
+        if once:
+            return
+        time.sleep(interval)
+
+
+class WorksheetServer:
+    """Long-running renderer that keeps the interpreter, imports and icon maps warm"""
+
+    # Minimum seconds between Prometheus textfile rewrites
+    EXPORT_INTERVAL = 5.0
+
+    def __init__(self, preload_theme=None, openmoji_dir=None, cache=None,
+                 metrics=None, prometheus_path=None, compact=False):
+        self.openmoji_dir = openmoji_dir
+        self.compact = compact
+        self.cache = cache
+        # Re-rendering an edited worksheet only redraws the pages that changed
+        self.page_cache = PageCache()
+        self.metrics = metrics
+        self.prometheus_path = prometheus_path
+        self._last_export = 0.0
+        self.started = time.time()
+        self.requests = 0
+        self.errors = 0
+        self.latencies = []
+        self.running = True
+        if preload_theme:
+            self.preload(preload_theme)
+
+    def preload(self, theme):
+        """Render a throwaway sheet with every object of a theme to warm all code paths"""
+        started = time.perf_counter()
+        objects = THEME_OBJECTS.get(theme, THEME_OBJECTS['default'])
+        for obj in objects:
+            get_display_list(obj)
+        spec = {
+            'title': 'Warm-up', 'grade': 1, 'topic': 'Warm-up', 'theme': theme,
+            'problems': [{'question': obj, 'answer': obj,
+                          'visual': {'type': 'countable_objects', 'object_type': obj, 'objects': [0, 1]}}
+                         for obj in objects],
+        }
+        self.render(spec)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"🔥 Preloaded theme '{theme}' ({len(objects)} objects) in {elapsed:.1f}ms", file=sys.stderr)
+        return {'theme': theme, 'objects': objects, 'ms': round(elapsed, 2)}
+
+    def render(self, spec):
+        """Render a worksheet spec; write files when paths are given, otherwise return base64 PDF bytes"""
+        if self.openmoji_dir and not spec.get('openmoji_dir'):
+            spec = dict(spec, openmoji_dir=self.openmoji_dir)
+        if self.compact:
+            spec = {'compact': True, **spec}
+        gen = HybridWorksheetGenerator.from_spec(spec, quiet=True, cache=self.cache,
+                                                 metrics=self.metrics, page_cache=self.page_cache)
+        if spec.get('output'):
+            result = {'icon_cache': gen.generate_worksheet(), 'output': spec['output']}
+        else:
+            pdf = gen.render_worksheet()
+            result = {'icon_cache': gen.icon_stats,
+                      'pdf_base64': base64.b64encode(pdf).decode('ascii')}
+        result['cached'] = gen.served_from_cache
+        if gen.culled:
+            result['culled'] = gen.culled
+        if gen.page_stats:
+            result['pages'] = gen.page_stats
+        result.update(_size_report([gen]))
+
+        answer_key = spec.get('answer_key')
+        if answer_key is True:
+            result['answer_key_base64'] = base64.b64encode(gen.render_answer_key()).decode('ascii')
+        elif answer_key:
+            gen.generate_answer_key(answer_key)
+            result['answer_key'] = answer_key
+        self.export_metrics()
+        return result
+
+    def preview(self, params):
+        """PNG preview of one page of a worksheet spec, as base64"""
+        spec = params
+        if self.openmoji_dir and not spec.get('openmoji_dir'):
+            spec = dict(spec, openmoji_dir=self.openmoji_dir)
+        gen = HybridWorksheetGenerator.from_spec(spec, quiet=True, cache=self.cache,
+                                                 metrics=self.metrics)
+        png = gen.render_preview(params.get('page', 1), params.get('dpi', 72),
+                                 params.get('backend', 'auto'))
+        self.export_metrics()
+        return {'png_base64': base64.b64encode(png).decode('ascii'), 'bytes': len(png),
+                'cached': gen.served_from_cache}
+
+    def markup(self, params):
+        """One worksheet page as SVG, or with html=true every page as an HTML document"""
+        spec = params
+        if self.openmoji_dir and not spec.get('openmoji_dir'):
+            spec = dict(spec, openmoji_dir=self.openmoji_dir)
+        gen = HybridWorksheetGenerator.from_spec(spec, quiet=True, cache=self.cache,
+                                                 metrics=self.metrics)
+        if params.get('html'):
+            result = {'html': gen.render_html()}
+        else:
+            result = {'svg': gen.render_svg(params.get('page', 1))}
+        self.export_metrics()
+        result.update({'bytes': sum(len(text.encode('utf-8')) for text in result.values()),
+                       'cached': gen.served_from_cache})
+        return result
+
+    def export_metrics(self, force=False):
+        """Rewrite the Prometheus textfile, at most once per EXPORT_INTERVAL unless forced"""
+        if not (self.metrics and self.prometheus_path):
+            return
+        now = time.monotonic()
+        if force or now - self._last_export >= self.EXPORT_INTERVAL:
+            self.metrics.write_prometheus(self.prometheus_path)
+            self._last_export = now
+
+    def stats(self):
+        """Request counts and latency percentiles since startup"""
+        latencies = sorted(self.latencies)
+        def percentile(p):
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))], 2)
+        return {
+            'output_cache': self.cache.stats() if self.cache else None,
+            'page_cache': self.page_cache.stats(),
+            'openmoji_drawings': openmoji_drawings.stats(),
+            'uptime_s': round(time.time() - self.started, 1),
+            'requests': self.requests,
+            'errors': self.errors,
+            'p50_ms': percentile(0.50),
+            'p95_ms': percentile(0.95),
+        }
+
+    def handle(self, request):
+        """Dispatch one JSON-RPC 2.0 request dict and return the response dict"""
+        req_id = request.get('id') if isinstance(request, dict) else None
+        started = time.perf_counter()
+        self.requests += 1
+        try:
+            if not isinstance(request, dict) or 'method' not in request:
+                raise ValueError('invalid request')
+            method = request['method']
+            params = request.get('params') or {}
+            if method == 'render':
+                result = self.render(params)
+            elif method == 'preview':
+                result = self.preview(params)
+            elif method == 'svg':
+                result = self.markup(params)
+            elif method == 'layout':
+                result = plan_layout(spec_problems(params)).to_dict()
+            elif method == 'preload':
+                result = self.preload(params.get('theme', 'default'))
+            elif method == 'ping':
+                result = 'pong'
+            elif method == 'stats':
+                result = self.stats()
+            elif method == 'metrics':
+                if self.metrics is None:
+                    raise ValueError('server was started without --profile')
+                result = self.metrics.report()
+            elif method == 'shutdown':
+                self.running = False
+                self.export_metrics(force=True)
+                result = 'bye'
+            else:
+                return {'jsonrpc': '2.0', 'id': req_id,
+                        'error': {'code': -32601, 'message': f'Method not found: {method}'}}
+            response = {'jsonrpc': '2.0', 'id': req_id, 'result': result}
+        except Exception as e:
+            self.errors += 1
+            response = {'jsonrpc': '2.0', 'id': req_id,
+                        'error': {'code': -32000, 'message': f'{type(e).__name__}: {e}'}}
+        self.latencies.append((time.perf_counter() - started) * 1000)
+        del self.latencies[:-10000]
+        return response
+
+    def handle_line(self, line):
+        """Decode one line of JSON-RPC and return the encoded response line"""
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            response = {'jsonrpc': '2.0', 'id': None,
+                        'error': {'code': -32700, 'message': f'Parse error: {e}'}}
+        else:
+            response = self.handle(request)
+        return json.dumps(response) + '\n'
+
+    def serve_stdio(self, out):
+        """Serve newline-delimited JSON-RPC on stdin, writing responses to out"""
+        print("🚀 Worksheet server ready on stdin/stdout", file=sys.stderr)
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            out.write(self.handle_line(line))
+            out.flush()
+            if not self.running:
+                break
+
+    def serve_socket(self, socket_path):
+        """Serve newline-delimited JSON-RPC on a local Unix socket, one request at a time"""
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    if not line.strip():
+                        continue
+                    self.wfile.write(server.handle_line(line).encode('utf-8'))
+                    self.wfile.flush()
+                    if not server.running:
+                        break
+
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        with socketserver.UnixStreamServer(socket_path, Handler) as unix_server:
+            print(f"🚀 Worksheet server listening on {socket_path}", file=sys.stderr)
+            while self.running:
+                unix_server.handle_request()
+        os.unlink(socket_path)
@@ -0,0 +1,178 @@
+"""
+SVG and HTML output: the generator's canvas calls emitted as SVG elements.
+
+No PDF is produced. Icon forms defined through IconFormCache become <g>
+elements in <defs> placed with <use>, so repeated icons cost one short
+element each, as they cost one form reference in a PDF. OpenMoji icons use
+their vector fallbacks (the generator draws with vector_only set).
+"""
+
+from html import escape
+
+from .backends import CanvasBackend
+
+FONT_FAMILY = 'Helvetica,Arial,sans-serif'
+
+# SVG font attributes for the standard fonts the generator uses
+FONT_STYLES = {
+    'Helvetica': '',
+    'Helvetica-Bold': ' font-weight="bold"',
+    'Helvetica-Oblique': ' font-style="italic"',
+}
+
+HTML_STYLE = ('body{margin:0;background:#e8e8e8}'
+              'svg.page{display:block;margin:16px auto;background:#fff;box-shadow:0 1px 4px #999}')
+
+
+def _num(value, precision=2):
+    """Shortest decimal form of a coordinate"""
+    text = f"{value:.{precision}f}".rstrip('0').rstrip('.')
+    return '0' if text == '-0' else text
+
+
+def _hex(rgb):
+    return '#%02x%02x%02x' % tuple(round(channel * 255) for channel in rgb)
+
+
+class SvgCanvas(CanvasBackend):
+    """Records the generator's canvas calls as SVG markup, one element list per page"""
+
+    def __init__(self, pagesize, precision=2):
+        super().__init__(pagesize)
+        self.precision = precision
+        self.pages = [[]]
+        self.forms = []
+        self._target = self.pages[0]
+        self._form_state = None
+
+    # Coordinates and attributes
+
+    def _xy(self, x, y):
+        """Page coordinates to SVG user space (y down); forms are drawn around their origin"""
+        ox, oy = self._origin
+        p = self.precision
+        if self._form_state is not None:
+            return _num(x + ox, p), _num(-(y + oy), p)
+        return _num(x + ox, p), _num(self.page_height - y - oy, p)
+
+    def _paint(self, fill, stroke):
+        """fill/stroke attributes, leaving out SVG's defaults (black fill, no stroke)"""
+        attrs = ''
+        if not fill:
+            attrs += ' fill="none"'
+        elif self._fill != (0.0, 0.0, 0.0):
+            attrs += f' fill="{_hex(self._fill)}"'
+        if stroke:
+            attrs += self._stroke_attrs()
+        return attrs
+
+    def _stroke_attrs(self):
+        attrs = f' stroke="{_hex(self._stroke)}"'
+        if self._line_width != 1:
+            attrs += f' stroke-width="{_num(self._line_width, self.precision)}"'
+        return attrs
+
+    # Shapes and text
+
+    def circle(self, x, y, r, fill=0, stroke=1):
+        cx, cy = self._xy(x, y)
+        self._target.append(f'<circle cx="{cx}" cy="{cy}" r="{_num(r, self.precision)}"'
+                            f'{self._paint(fill, stroke)}/>')
+
+    def ellipse(self, x1, y1, x2, y2, fill=0, stroke=1):
+        cx, cy = self._xy((x1 + x2) / 2, (y1 + y2) / 2)
+        p = self.precision
+        self._target.append(f'<ellipse cx="{cx}" cy="{cy}" rx="{_num(abs(x2 - x1) / 2, p)}" '
+                            f'ry="{_num(abs(y2 - y1) / 2, p)}"{self._paint(fill, stroke)}/>')
+
+    def rect(self, x, y, width, height, fill=0, stroke=1):
+        left, top = self._xy(min(x, x + width), max(y, y + height))
+        p = self.precision
+        self._target.append(f'<rect x="{left}" y="{top}" width="{_num(abs(width), p)}" '
+                            f'height="{_num(abs(height), p)}"{self._paint(fill, stroke)}/>')
+
+    def line(self, x1, y1, x2, y2):
+        (ax, ay), (bx, by) = self._xy(x1, y1), self._xy(x2, y2)
+        self._target.append(f'<line x1="{ax}" y1="{ay}" x2="{bx}" y2="{by}"{self._stroke_attrs()}/>')
+
+    def drawPath(self, path, fill=0, stroke=1):
+        commands = []
+        for segment in path.segments:
+            op = segment[0]
+            if op == 'Z':
+                commands.append('Z')
+            else:
+                points = segment[1:]
+                coords = ' '.join(' '.join(self._xy(points[i], points[i + 1]))
+                                  for i in range(0, len(points), 2))
+                commands.append(f'{op}{coords}')
+        if commands:
+            d = ''.join(commands)
+            self._target.append(f'<path d="{d}"{self._paint(fill, stroke)}/>')
+
+    def _text(self, x, y, text, anchor=''):
+        name, size = self._font
+        tx, ty = self._xy(x, y)
+        fill = f' fill="{_hex(self._fill)}"' if self._fill != (0.0, 0.0, 0.0) else ''
+        self._target.append(f'<text x="{tx}" y="{ty}" font-size="{_num(size, self.precision)}"'
+                            f'{FONT_STYLES.get(name, "")}{anchor}{fill}>{escape(text, quote=False)}</text>')
+
+    def drawString(self, x, y, text):
+        self._text(x, y, text)
+
+    def drawCentredString(self, x, y, text):
+        self._text(x, y, text, ' text-anchor="middle"')
+
+    # Forms, placed with <use>
+
+    def beginForm(self, name, x1=0, y1=0, x2=None, y2=None):
+        # Like reportlab, a form starts from the default state and leaves the page's untouched
+        self.saveState()
+        self._init_state()
+        self._form_state = self._target
+        self._target = [f'<g id="{name}">']
+
+    def endForm(self):
+        self._target.append('</g>')
+        self.forms.append(''.join(self._target))
+        self._target = self._form_state
+        self._form_state = None
+        self.restoreState()
+
+    def doForm(self, name):
+        x, y = self._xy(0, 0)
+        self._target.append(f'<use href="#{name}" x="{x}" y="{y}"/>')
+
+    # Pages and documents
+
+    def showPage(self):
+        super().showPage()
+        self._target = []
+        self.pages.append(self._target)
+
+    def _page_count(self):
+        # showPage after the last page leaves an empty trailing page behind
+        return len(self.pages) - 1 if len(self.pages) > 1 and not self.pages[-1] else len(self.pages)
+
+    def _open_svg(self, extra=''):
+        width, height = _num(self.page_width), _num(self.page_height)
+        return (f'<svg xmlns="http://www.w3.org/2000/svg"{extra} width="{width}" height="{height}" '
+                f'viewBox="0 0 {width} {height}" font-family="{FONT_FAMILY}">')
+
+    def svg(self, page=1):
+        """Standalone SVG document for one page, carrying every form it may use"""
+        defs = f"<defs>{''.join(self.forms)}</defs>" if self.forms else ''
+        return f"{self._open_svg()}{defs}{''.join(self.pages[page - 1])}</svg>"
+
+    def html(self, title=''):
+        """HTML document with every page as inline SVG sharing one set of form definitions"""
+        parts = ['<!DOCTYPE html><html><head><meta charset="utf-8">',
+                 f'<title>{escape(title)}</title><style>{HTML_STYLE}</style></head><body>']
+        if self.forms:
+            parts.append('<svg xmlns="http://www.w3.org/2000/svg" width="0" height="0" '
+                         f'style="position:absolute"><defs>{"".join(self.forms)}</defs></svg>')
+        page_class = ' class="page"'
+        for elements in self.pages[:self._page_count()]:
+            parts.append(f"{self._open_svg(page_class)}{''.join(elements)}</svg>")
+        parts.append('</body></html>')
+        return ''.join(parts)
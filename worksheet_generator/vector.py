@@ -0,0 +1,729 @@
+"""
+Hand-drawn vector objects and their compiled display lists.
+"""
+
+import math
+
+from reportlab.lib import colors
+
+from .registry import OBJECT_REGISTRY
+
+
+class VectorGraphicsLibrary:
+    """Comprehensive library of hand-drawn vector objects"""
+    
+    @staticmethod
+    def draw_apple(c, x, y, size=20):
+        """Draw an apple"""
+        c.setFillColor(colors.HexColor('#FF4444'))
+        c.circle(x, y, size, fill=1, stroke=1)
+        c.setStrokeColor(colors.HexColor('#8B4513'))
+        c.setLineWidth(2)
+        c.line(x, y + size, x, y + size + 5)
+        c.setFillColor(colors.HexColor('#228B22'))
+        path = c.beginPath()
+        path.moveTo(x, y + size + 5)
+        path.curveTo(x + 5, y + size + 8, x + 8, y + size + 5, x + 8, y + size + 2)
+        path.curveTo(x + 8, y + size, x + 5, y + size, x, y + size + 5)
+        c.drawPath(path, fill=1, stroke=1)
+        c.setFillColor(colors.black)
+        c.setStrokeColor(colors.black)
+    
+    @staticmethod
+    def draw_banana(c, x, y, size=20):
+        """Draw a banana"""
+        c.setFillColor(colors.HexColor('#FFE135'))
+        path = c.beginPath()
+        path.moveTo(x - size*0.8, y + size*0.3)
+        path.curveTo(x - size*0.5, y + size*0.8, x + size*0.5, y + size*0.5, x + size*0.8, y - size*0.3)
+        path.curveTo(x + size*0.6, y - size*0.5, x - size*0.3, y - size*0.2, x - size*0.8, y + size*0.3)
+        c.drawPath(path, fill=1, stroke=1)
+        c.setFillColor(colors.black)
+    
+    @staticmethod
+    def draw_orange(c, x, y, size=20):
+        """Draw an orange"""
+        c.setFillColor(colors.HexColor('#FF8C00'))
+        c.circle(x, y, size, fill=1, stroke=1)
+        c.setFillColor(colors.HexColor('#228B22'))
+        c.circle(x, y + size, 3, fill=1, stroke=1)
+        c.setFillColor(colors.black)
+    
+    @staticmethod
+    def draw_strawberry(c, x, y, size=20):
+        """Draw a strawberry"""
+        c.setFillColor(colors.HexColor('#FF1744'))
+        path = c.beginPath()
+        path.moveTo(x, y - size)
+        path.curveTo(x - size*0.7, y - size*0.5, x - size*0.7, y + size*0.3, x, y + size*0.6)
+        path.curveTo(x + size*0.7, y + size*0.3, x + size*0.7, y - size*0.5, x, y - size)
+        c.drawPath(path, fill=1, stroke=1)
+        c.setFillColor(colors.HexColor('#FFFF00'))
+        for dot_y in [y - size*0.5, y, y + size*0.3]:
+            for dot_x in [x - size*0.3, x, x + size*0.3]:
+                c.circle(dot_x, dot_y, 1.5, fill=1, stroke=0)
+        c.setFillColor(colors.HexColor('#228B22'))
+        for i in range(-1, 2):
+            path = c.beginPath()
+            path.moveTo(x + i*size*0.3, y - size)
+            path.lineTo(x + i*size*0.4, y - size - 5)
+            path.lineTo(x + i*size*0.2, y - size)
+            c.drawPath(path, fill=1, stroke=0)
+        c.setFillColor(colors.black)
+    
+    @staticmethod
+    def draw_cookie(c, x, y, size=20):
+        """Draw a cookie"""
+        c.setFillColor(colors.HexColor('#D2691E'))
+        c.circle(x, y, size, fill=1, stroke=1)
+        c.setFillColor(colors.HexColor('#4B2F23'))
+        chip_positions = [(x - size*0.4, y + size*0.3), (x + size*0.3, y + size*0.4),
+                         (x - size*0.2, y - size*0.3), (x + size*0.4, y - size*0.2), (x, y)]
+        for chip_x, chip_y in chip_positions:
+            c.circle(chip_x, chip_y, 3, fill=1, stroke=0)
+        c.setFillColor(colors.black)
+    
+    @staticmethod
+    def draw_pizza(c, x, y, size=20):
+        """Draw a pizza slice"""
+        c.setFillColor(colors.HexColor('#FFD700'))
+        path = c.beginPath()
+        path.moveTo(x, y - size)
+        path.lineTo(x - size*0.8, y + size*0.6)
+        path.curveTo(x - size*0.5, y + size*0.8, x + size*0.5, y + size*0.8, x + size*0.8, y + size*0.6)
+        path.close()
+        c.drawPath(path, fill=1, stroke=1)
+        c.setFillColor(colors.HexColor('#FF4444'))
+        for px, py in [(x-size*0.3, y), (x+size*0.2, y+size*0.2), (x, y+size*0.4)]:
+            c.circle(px, py, 3, fill=1, stroke=0)
+        c.setFillColor(colors.black)
+    
+    @staticmethod
+    def draw_carrot(c, x, y, size=20):
+        """Draw a carrot"""
+        c.setFillColor(colors.HexColor('#FF8C00'))
+        path = c.beginPath()
+        path.moveTo(x, y - size)
+        path.lineTo(x - size*0.3, y + size*0.8)
+        path.lineTo(x + size*0.3, y + size*0.8)
+        path.close()
+        c.drawPath(path, fill=1, stroke=1)
+        c.setFillColor(colors.HexColor('#228B22'))
+        for i in range(-1, 2):
+            c.line(x + i*3, y - size, x + i*4, y - size - 8)
+        c.setFillColor(colors.black)
+    
+    @staticmethod
+    def draw_dog(c, x, y, size=20):
+        """Draw a dog face"""
+        c.setFillColor(colors.HexColor('#D2691E'))
+        c.circle(x, y, size, fill=1, stroke=1)
+        c.circle(x - size*0.7, y + size*0.5, size*0.4, fill=1, stroke=1)
+        c.circle(x + size*0.7, y + size*0.5, size*0.4, fill=1, stroke=1)
+        c.setFillColor(colors.white)
+        c.circle(x - size*0.3, y + size*0.2, 4, fill=1, stroke=1)
+        c.circle(x + size*0.3, y + size*0.2, 4, fill=1, stroke=1)
+        c.setFillColor(colors.black)
+        c.circle(x - size*0.3, y + size*0.2, 2, fill=1, stroke=0)
+        c.circle(x + size*0.3, y + size*0.2, 2, fill=1, stroke=0)
+        c.circle(x, y - size*0.2, 3, fill=1, stroke=1)
+    
+    @staticmethod
+    def draw_cat(c, x, y, size=20):
+        """Draw a cat face"""
+        c.setFillColor(colors.HexColor('#FF8C00'))
+        c.circle(x, y, size, fill=1, stroke=1)
+        path = c.beginPath()
+        path.moveTo(x - size*0.8, y + size*0.5)
+        path.lineTo(x - size*0.5, y + size)
+        path.lineTo(x - size*0.3, y + size*0.7)
+        c.drawPath(path, fill=1, stroke=1)
+        path = c.beginPath()
+        path.moveTo(x + size*0.8, y + size*0.5)
+        path.lineTo(x + size*0.5, y + size)
+        path.lineTo(x + size*0.3, y + size*0.7)
+        c.drawPath(path, fill=1, stroke=1)
+        c.setFillColor(colors.white)
+        c.circle(x - size*0.3, y + size*0.2, 4, fill=1, stroke=1)
+        c.circle(x + size*0.3, y + size*0.2, 4, fill=1, stroke=1)
+        c.setFillColor(colors.black)
+        c.circle(x - size*0.3, y + size*0.2, 2, fill=1, stroke=0)
+        c.circle(x + size*0.3, y + size*0.2, 2, fill=1, stroke=0)
+        c.circle(x, y - size*0.2, 3, fill=1, stroke=1)
+        for i in [-1, 1]:
+            c.line(x, y - size*0.2, x + i*size*0.6, y - size*0.3)
+    
+    @staticmethod
+    def draw_rabbit(c, x, y, size=20):
+        """Draw a rabbit"""
+        c.setFillColor(colors.HexColor('#E0E0E0'))
+        c.circle(x, y, size*0.8, fill=1, stroke=1)
+        c.ellipse(x - size*0.6, y + size*0.4, x - size*0.3, y + size*1.2, fill=1, stroke=1)
+        c.ellipse(x + size*0.3, y + size*0.4, x + size*0.6, y + size*1.2, fill=1, stroke=1)
+        c.setFillColor(colors.white)
+        c.circle(x - size*0.25, y + size*0.15, 3, fill=1, stroke=1)
+        c.circle(x + size*0.25, y + size*0.15, 3, fill=1, stroke=1)
+        c.setFillColor(colors.black)
+        c.circle(x - size*0.25, y + size*0.15, 1.5, fill=1, stroke=0)
+        c.circle(x + size*0.25, y + size*0.15, 1.5, fill=1, stroke=0)
+        c.circle(x, y - size*0.2, 2, fill=1, stroke=1)
+    
+    @staticmethod
+    def draw_bear(c, x, y, size=20):
+        """Draw a bear"""
+        c.setFillColor(colors.HexColor('#8B4513'))
+        c.circle(x, y, size, fill=1, stroke=1)
+        c.circle(x - size*0.8, y + size*0.8, size*0.4, fill=1, stroke=1)
+        c.circle(x + size*0.8, y + size*0.8, size*0.4, fill=1, stroke=1)
+        c.setFillColor(colors.HexColor('#D2691E'))
+        c.circle(x, y - size*0.3, size*0.4, fill=1, stroke=1)
+        c.setFillColor(colors.white)
+        c.circle(x - size*0.3, y + size*0.2, 4, fill=1, stroke=1)
+        c.circle(x + size*0.3, y + size*0.2, 4, fill=1, stroke=1)
+        c.setFillColor(colors.black)
+        c.circle(x - size*0.3, y + size*0.2, 2, fill=1, stroke=0)
+        c.circle(x + size*0.3, y + size*0.2, 2, fill=1, stroke=0)
+        c.circle(x, y - size*0.3, 2, fill=1, stroke=1)
+    
+    @staticmethod
+    def draw_fish(c, x, y, size=20):
+        """Draw a fish"""
+        c.setFillColor(colors.HexColor('#4A90E2'))
+        path = c.beginPath()
+        path.moveTo(x - size, y)
+        path.curveTo(x - size, y + size*0.6, x + size*0.5, y + size*0.6, x + size*0.5, y)
+        path.curveTo(x + size*0.5, y - size*0.6, x - size, y - size*0.6, x - size, y)
+        c.drawPath(path, fill=1, stroke=1)
+        path = c.beginPath()
+        path.moveTo(x - size, y)
+        path.lineTo(x - size - 8, y + 8)
+        path.lineTo(x - size - 8, y - 8)
+        path.close()
+        c.drawPath(path, fill=1, stroke=1)
+        c.setFillColor(colors.white)
+        c.circle(x + size*0.2, y + size*0.2, 3, fill=1, stroke=1)
+        c.setFillColor(colors.black)
+        c.circle(x + size*0.2, y + size*0.2, 1.5, fill=1, stroke=0)
+        c.setFillColor(colors.black)
+    
+    @staticmethod
+    def draw_butterfly(c, x, y, size=20):
+        """Draw a butterfly"""
+        c.setFillColor(colors.HexColor('#4B2F23'))
+        c.rect(x - 2, y - size*0.8, 4, size*1.6, fill=1, stroke=0)
+        c.setFillColor(colors.HexColor('#FF6B9D'))
+        for angle, scale in [(0.3, 0.8), (-0.3, 0.7)]:
+            path = c.beginPath()
+            path.moveTo(x, y + size*angle)
+            path.curveTo(x - size*scale, y + size*(angle+0.5), x - size*scale, y + size*angle, x, y)
+            c.drawPath(path, fill=1, stroke=1)
+            path = c.beginPath()
+            path.moveTo(x, y + size*angle)
+            path.curveTo(x + size*scale, y + size*(angle+0.5), x + size*scale, y + size*angle, x, y)
+            c.drawPath(path, fill=1, stroke=1)
+        c.setStrokeColor(colors.HexColor('#4B2F23'))
+        c.setLineWidth(1)
+        c.line(x - 2, y + size*0.8, x - 5, y + size + 5)
+        c.line(x + 2, y + size*0.8, x + 5, y + size + 5)
+        c.circle(x - 5, y + size + 5, 2, fill=1, stroke=0)
+        c.circle(x + 5, y + size + 5, 2, fill=1, stroke=0)
+        c.setFillColor(colors.black)
+        c.setStrokeColor(colors.black)
+    
+    @staticmethod
+    def draw_bee(c, x, y, size=20):
+        """Draw a bee"""
+        c.setFillColor(colors.HexColor('#FFD700'))
+        c.ellipse(x - size*0.6, y - size*0.4, x + size*0.6, y + size*0.4, fill=1, stroke=1)
+        c.setFillColor(colors.black)
+        for stripe_y in [y - size*0.15, y + size*0.15]:
+            c.rect(x - size*0.6, stripe_y - 2, size*1.2, 4, fill=1, stroke=0)
+        c.setFillColor(colors.HexColor('#87CEEB'))
+        for wing_x in [x - size*0.3, x + size*0.3]:
+            c.ellipse(wing_x - size*0.3, y + size*0.2, wing_x + size*0.3, y + size*0.8, fill=1, stroke=1)
+        c.setFillColor(colors.black)
+    
+    @staticmethod
+    def draw_star(c, x, y, size=20):
+        """Draw a 5-pointed star"""
+        c.setFillColor(colors.HexColor('#FFD700'))
+        points = []
+        for i in range(10):
+            angle = math.pi / 2 + i * math.pi / 5
+            r = size if i % 2 == 0 else size / 2.5
+            px = x + r * math.cos(angle)
+            py = y + r * math.sin(angle)
+            points.extend([px, py])
+        path = c.beginPath()
+        path.moveTo(points[0], points[1])
+        for i in range(2, len(points), 2):
+            path.lineTo(points[i], points[i+1])
+        path.close()
+        c.drawPath(path, fill=1, stroke=1)
+        c.setFillColor(colors.black)
+    
+    @staticmethod
+    def draw_sun(c, x, y, size=20):
+        """Draw a sun"""
+        c.setFillColor(colors.HexColor('#FFD700'))
+        c.circle(x, y, size*0.6, fill=1, stroke=1)
+        for i in range(8):
+            angle = i * math.pi / 4
+            start_x = x + size*0.7 * math.cos(angle)
+            start_y = y + size*0.7 * math.sin(angle)
+            end_x = x + size * math.cos(angle)
+            end_y = y + size * math.sin(angle)
+            c.setLineWidth(3)
+            c.line(start_x, start_y, end_x, end_y)
+        c.setFillColor(colors.black)
+    
+    @staticmethod
+    def draw_moon(c, x, y, size=20):
+        """Draw a crescent moon"""
+        c.setFillColor(colors.HexColor('#FFD700'))
+        c.circle(x, y, size, fill=1, stroke=1)
+        c.setFillColor(colors.white)
+        c.circle(x + size*0.3, y, size*0.8, fill=1, stroke=0)
+        c.setFillColor(colors.black)
+    
+    @staticmethod
+    def draw_rocket(c, x, y, size=20):
+        """Draw a rocket"""
+        c.setFillColor(colors.HexColor('#FF4444'))
+        path = c.beginPath()
+        path.moveTo(x, y + size)
+        path.lineTo(x - size*0.4, y + size*0.2)
+        path.lineTo(x - size*0.4, y - size*0.6)
+        path.lineTo(x + size*0.4, y - size*0.6)
+        path.lineTo(x + size*0.4, y + size*0.2)
+        path.close()
+        c.drawPath(path, fill=1, stroke=1)
+        c.setFillColor(colors.HexColor('#87CEEB'))
+        c.circle(x, y + size*0.4, size*0.25, fill=1, stroke=1)
+        c.setFillColor(colors.HexColor('#FFD700'))
+        path = c.beginPath()
+        path.moveTo(x - size*0.4, y - size*0.6)
+        path.lineTo(x - size*0.6, y - size)
+        path.lineTo(x, y - size*0.6)
+        c.drawPath(path, fill=1, stroke=1)
+        path = c.beginPath()
+        path.moveTo(x + size*0.4, y - size*0.6)
+        path.lineTo(x + size*0.6, y - size)
+        path.lineTo(x, y - size*0.6)
+        c.drawPath(path, fill=1, stroke=1)
+        c.setFillColor(colors.black)
+    
+    @staticmethod
+    def draw_car(c, x, y, size=20):
+        """Draw a car"""
+        c.setFillColor(colors.HexColor('#FF4444'))
+        c.rect(x - size, y - size*0.3, size*2, size*0.6, fill=1, stroke=1)
+        path = c.beginPath()
+        path.moveTo(x - size*0.5, y + size*0.3)
+        path.lineTo(x - size*0.3, y + size*0.8)
+        path.lineTo(x + size*0.3, y + size*0.8)
+        path.lineTo(x + size*0.5, y + size*0.3)
+        path.close()
+        c.drawPath(path, fill=1, stroke=1)
+        c.setFillColor(colors.HexColor('#87CEEB'))
+        c.rect(x - size*0.4, y + size*0.35, size*0.3, size*0.35, fill=1, stroke=1)
+        c.rect(x + size*0.1, y + size*0.35, size*0.3, size*0.35, fill=1, stroke=1)
+        c.setFillColor(colors.HexColor('#2F2F2F'))
+        c.circle(x - size*0.6, y - size*0.3, size*0.25, fill=1, stroke=1)
+        c.circle(x + size*0.6, y - size*0.3, size*0.25, fill=1, stroke=1)
+        c.setFillColor(colors.black)
+    
+    @staticmethod
+    def draw_tree(c, x, y, size=20):
+        """Draw a tree"""
+        c.setFillColor(colors.HexColor('#8B4513'))
+        c.rect(x - size*0.2, y - size, size*0.4, size*0.8, fill=1, stroke=1)
+        c.setFillColor(colors.HexColor('#228B22'))
+        c.circle(x, y + size*0.3, size*0.6, fill=1, stroke=1)
+        c.circle(x - size*0.4, y + size*0.5, size*0.5, fill=1, stroke=1)
+        c.circle(x + size*0.4, y + size*0.5, size*0.5, fill=1, stroke=1)
+        c.setFillColor(colors.black)
+    
+    @staticmethod
+    def draw_flower(c, x, y, size=20):
+        """Draw a flower"""
+        c.setFillColor(colors.HexColor('#FF69B4'))
+        for i in range(5):
+            angle = i * 2 * math.pi / 5
+            petal_x = x + size * 0.5 * math.cos(angle)
+            petal_y = y + size * 0.5 * math.sin(angle)
+            c.circle(petal_x, petal_y, size * 0.4, fill=1, stroke=1)
+        c.setFillColor(colors.HexColor('#FFD700'))
+        c.circle(x, y, size * 0.3, fill=1, stroke=1)
+        c.setFillColor(colors.black)
+    
+    @staticmethod
+    def draw_heart(c, x, y, size=20):
+        """Draw a heart"""
+        c.setFillColor(colors.HexColor('#FF1744'))
+        s = size / 20
+        path = c.beginPath()
+        path.moveTo(x, y - 10*s)
+        path.curveTo(x - 5*s, y - 15*s, x - 10*s, y - 10*s, x - 10*s, y - 5*s)
+        path.curveTo(x - 10*s, y, x - 5*s, y + 5*s, x, y + 10*s)
+        path.curveTo(x + 5*s, y + 5*s, x + 10*s, y, x + 10*s, y - 5*s)
+        path.curveTo(x + 10*s, y - 10*s, x + 5*s, y - 15*s, x, y - 10*s)
+        path.close()
+        c.drawPath(path, fill=1, stroke=1)
+        c.setFillColor(colors.black)
+    
+    @staticmethod
+    def draw_circle(c, x, y, size=20):
+        """Draw a simple circle"""
+        c.setFillColor(colors.HexColor('#4A90E2'))
+        c.circle(x, y, size, fill=1, stroke=1)
+        c.setFillColor(colors.black)
+    
+    @staticmethod
+    def draw_square(c, x, y, size=20):
+        """Draw a simple square"""
+        c.setFillColor(colors.HexColor('#4A90E2'))
+        c.rect(x - size/2, y - size/2, size, size, fill=1, stroke=1)
+        c.setFillColor(colors.black)
+    
+    @staticmethod
+    def draw_triangle(c, x, y, size=20):
+        """Draw a triangle"""
+        c.setFillColor(colors.HexColor('#4A90E2'))
+        path = c.beginPath()
+        path.moveTo(x, y + size)
+        path.lineTo(x - size * 0.866, y - size/2)
+        path.lineTo(x + size * 0.866, y - size/2)
+        path.close()
+        c.drawPath(path, fill=1, stroke=1)
+        c.setFillColor(colors.black)
+    
+    @staticmethod
+    def draw_book(c, x, y, size=20):
+        """Draw a book"""
+        c.setFillColor(colors.HexColor('#4A90E2'))
+        c.rect(x - size*0.6, y - size*0.8, size*1.2, size*1.6, fill=1, stroke=1)
+        c.setStrokeColor(colors.white)
+        c.setLineWidth(2)
+        c.line(x, y - size*0.8, x, y + size*0.8)
+        c.setStrokeColor(colors.black)
+        c.setFillColor(colors.black)
+    
+    @staticmethod
+    def draw_pencil(c, x, y, size=20):
+        """Draw a pencil"""
+        c.setFillColor(colors.HexColor('#FFD700'))
+        c.rect(x - size*0.2, y - size, size*0.4, size*1.6, fill=1, stroke=1)
+        c.setFillColor(colors.HexColor('#FF69B4'))
+        c.rect(x - size*0.2, y + size*0.5, size*0.4, size*0.3, fill=1, stroke=1)
+        c.setFillColor(colors.HexColor('#D2691E'))
+        path = c.beginPath()
+        path.moveTo(x - size*0.2, y - size)
+        path.lineTo(x, y - size - size*0.3)
+        path.lineTo(x + size*0.2, y - size)
+        path.close()
+        c.drawPath(path, fill=1, stroke=1)
+        c.setFillColor(colors.black)
+
+
+# Map of object names to drawing functions
+VECTOR_METHODS = {name: getattr(VectorGraphicsLibrary, meta['draw'])
+                  for name, meta in OBJECT_REGISTRY.items()}
+
+
+class _RecordedPath:
+    """Path stand-in that records segments for a display list"""
+
+    def __init__(self):
+        self.segments = []
+
+    def moveTo(self, x, y):
+        self.segments.append(('M', x, y))
+
+    def lineTo(self, x, y):
+        self.segments.append(('L', x, y))
+
+    def curveTo(self, x1, y1, x2, y2, x3, y3):
+        self.segments.append(('C', x1, y1, x2, y2, x3, y3))
+
+    def close(self):
+        self.segments.append(('Z',))
+
+
+class DisplayListRecorder:
+    """Canvas stand-in that records the drawing calls made by the vector icons"""
+
+    def __init__(self):
+        self.ops = []
+
+    def setFillColor(self, color):
+        self.ops.append(('fill', color))
+
+    def setStrokeColor(self, color):
+        self.ops.append(('stroke', color))
+
+    def setLineWidth(self, width):
+        self.ops.append(('width', width))
+
+    def circle(self, x, y, r, stroke=1, fill=0):
+        self.ops.append(('circle', x, y, r, fill, stroke))
+
+    def ellipse(self, x1, y1, x2, y2, stroke=1, fill=0):
+        self.ops.append(('ellipse', x1, y1, x2, y2, fill, stroke))
+
+    def rect(self, x, y, width, height, stroke=1, fill=0):
+        self.ops.append(('rect', x, y, width, height, fill, stroke))
+
+    def line(self, x1, y1, x2, y2):
+        self.ops.append(('line', x1, y1, x2, y2))
+
+    def beginPath(self):
+        return _RecordedPath()
+
+    def drawPath(self, path, stroke=1, fill=0):
+        self.ops.append(('path', tuple(path.segments), fill, stroke))
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _size_terms(at_one, at_two):
+    """Split recorded values into (constant, per-size) terms: value = constant + k * size"""
+    if isinstance(at_one, tuple):
+        return tuple(_size_terms(a, b) for a, b in zip(at_one, at_two))
+    if _is_number(at_one):
+        k = at_two - at_one
+        return ('#', at_one, 0) if k == 0 else ('#', at_one - k, k)
+    return at_one
+
+
+def _at_size(terms, size):
+    """Evaluate size terms produced by _size_terms"""
+    if isinstance(terms, tuple):
+        if terms and terms[0] == '#':
+            return terms[1] if terms[2] == 0 else terms[1] + terms[2] * size
+        return tuple(_at_size(t, size) for t in terms)
+    return terms
+
+
+def _same_ops(ops_a, ops_b, tolerance=1e-6):
+    """Compare two recorded op lists, allowing float rounding"""
+    if isinstance(ops_a, (tuple, list)):
+        return (isinstance(ops_b, (tuple, list)) and len(ops_a) == len(ops_b)
+                and all(_same_ops(a, b, tolerance) for a, b in zip(ops_a, ops_b)))
+    if _is_number(ops_a):
+        return _is_number(ops_b) and abs(ops_a - ops_b) <= tolerance
+    return ops_a == ops_b
+
+
+class DisplayList:
+    """Vector icon compiled once into primitive operations with resolved colors.
+    
+    The icons mix size-relative and fixed offsets, but every coordinate is
+    affine in size, so recording at two sizes gives an exact size-parametric
+    list. Instances at a concrete size are memoized; drawing is then a replay
+    with translation onto any canvas-like backend.
+    """
+
+    def __init__(self, draw_func):
+        self.draw_func = draw_func
+        at_one = self._record(1)
+        at_two = self._record(2)
+        self.terms = tuple(_size_terms(a, b) for a, b in zip(at_one, at_two))
+        self.linear = (len(at_one) == len(at_two)
+                       and _same_ops(_at_size(self.terms, 20), self._record(20)))
+        self._sized = {}
+        self._batches = {}
+
+    def _record(self, size):
+        recorder = DisplayListRecorder()
+        self.draw_func(recorder, 0, 0, size)
+        return tuple(recorder.ops)
+
+    def at_size(self, size):
+        """Concrete operations for an icon of the given size centered at the origin"""
+        ops = self._sized.get(size)
+        if ops is None:
+            ops = _at_size(self.terms, size) if self.linear else self._record(size)
+            self._sized[size] = ops
+        return ops
+
+    def replay(self, c, x, y, size=20):
+        """Draw the icon centered at (x, y) on a canvas-like object"""
+        for op in self.at_size(size):
+            kind = op[0]
+            if kind == 'fill':
+                c.setFillColor(op[1])
+            elif kind == 'stroke':
+                c.setStrokeColor(op[1])
+            elif kind == 'width':
+                c.setLineWidth(op[1])
+            elif kind == 'circle':
+                c.circle(x + op[1], y + op[2], op[3], fill=op[4], stroke=op[5])
+            elif kind == 'path':
+                path = c.beginPath()
+                for seg in op[1]:
+                    if seg[0] == 'M':
+                        path.moveTo(x + seg[1], y + seg[2])
+                    elif seg[0] == 'L':
+                        path.lineTo(x + seg[1], y + seg[2])
+                    elif seg[0] == 'C':
+                        path.curveTo(x + seg[1], y + seg[2], x + seg[3], y + seg[4],
+                                     x + seg[5], y + seg[6])
+                    else:
+                        path.close()
+                c.drawPath(path, fill=op[2], stroke=op[3])
+            elif kind == 'rect':
+                c.rect(x + op[1], y + op[2], op[3], op[4], fill=op[5], stroke=op[6])
+            elif kind == 'ellipse':
+                c.ellipse(x + op[1], y + op[2], x + op[3], y + op[4], fill=op[5], stroke=op[6])
+            elif kind == 'line':
+                c.line(x + op[1], y + op[2], x + op[3], y + op[4])
+
+    def rect_batch(self, size):
+        """(state, rects, fill, stroke) when the icon at size paints only rectangles in one
+        state, so any number of copies can share one path; else None"""
+        if size not in self._batches:
+            self._batches[size] = _rect_batch(self.at_size(size))
+        return self._batches[size]
+
+    def replay_batch(self, c, batch, points):
+        """Draw the icon at every (x, y) of points as one path, given its rect_batch"""
+        state, rects, fill, stroke = batch
+        # Like a form, the batch leaves the canvas state as it found it
+        # (silhouettes drop the icons' trailing color resets)
+        c.saveState()
+        for op in state:
+            _set_state(c, op)
+        path = c.beginPath()
+        for x, y in points:
+            for rx, ry, width, height in rects:
+                path.rect(x + rx, y + ry, width, height)
+        c.drawPath(path, fill=fill, stroke=stroke)
+        c.restoreState()
+
+
+def _set_state(c, op):
+    """Apply a recorded fill, stroke or width operation"""
+    if op[0] == 'fill':
+        c.setFillColor(op[1])
+    elif op[0] == 'stroke':
+        c.setStrokeColor(op[1])
+    else:
+        c.setLineWidth(op[1])
+
+
+def _rect_batch(ops):
+    """See DisplayList.rect_batch.
+
+    Copies of an icon do not overlap, so painting them all in one path looks
+    the same as painting them one by one. Within an icon, rectangles may only
+    be merged when they are not outlined: a merged outline would show through
+    overlapping fills.
+    """
+    shapes = [i for i, op in enumerate(ops) if op[0] not in ('fill', 'stroke', 'width')]
+    if not shapes:
+        return None
+    body = ops[shapes[0]:shapes[-1] + 1]
+    if any(op[0] != 'rect' for op in body) or len({op[5:] for op in body}) != 1:
+        return None
+    fill, stroke = body[0][5:]
+    if stroke and len(body) > 1:
+        return None
+    return ops[:shapes[0]], tuple(op[1:5] for op in body), fill, stroke
+
+
+_SHAPE_OPS = ('circle', 'rect', 'ellipse', 'path')
+
+
+def _op_extent(op):
+    """Largest dimension of a shape operation (0 for lines and state changes)"""
+    kind = op[0]
+    if kind == 'circle':
+        return 2 * op[3]
+    if kind == 'rect':
+        return max(abs(op[3]), abs(op[4]))
+    if kind == 'ellipse':
+        return max(abs(op[3] - op[1]), abs(op[4] - op[2]))
+    if kind == 'path':
+        xs = [value for seg in op[1] for value in seg[1::2]]
+        ys = [value for seg in op[1] for value in seg[2::2]]
+        return max(max(xs) - min(xs), max(ys) - min(ys)) if xs else 0
+    return 0
+
+
+def _silhouette(ops, min_extent):
+    """Keep only large shapes, drop outlines of filled shapes and unused state changes"""
+    largest = max((_op_extent(op) for op in ops if op[0] in _SHAPE_OPS), default=0)
+    state = {}
+    emitted = {}
+    kept = []
+    for op in ops:
+        kind = op[0]
+        if kind in ('fill', 'stroke', 'width'):
+            state[kind] = op
+            continue
+        if kind not in _SHAPE_OPS or _op_extent(op) < min_extent * largest:
+            continue
+        filled = op[-2]
+        if filled:
+            op = op[:-1] + (0,)
+        for key in (('fill',) if filled else ('stroke', 'width')):
+            if key in state and emitted.get(key) != state[key]:
+                kept.append(state[key])
+                emitted[key] = state[key]
+        kept.append(op)
+    return tuple(kept)
+
+
+class SilhouetteList(DisplayList):
+    """Level-of-detail version of a display list for small or numerous icons.
+    
+    Keeps the shapes at least min_extent of the icon's largest shape, filled
+    without outlines; stems, seeds, eyes and other fine detail are dropped.
+    """
+
+    def __init__(self, display_list, min_extent=0.4):
+        self.source = display_list
+        self.min_extent = min_extent
+        self._sized = {}
+        self._batches = {}
+
+    def at_size(self, size):
+        """Simplified operations for an icon of the given size centered at the origin"""
+        ops = self._sized.get(size)
+        if ops is None:
+            ops = self._sized[size] = _silhouette(self.source.at_size(size), self.min_extent)
+        return ops
+
+
+# Display lists compiled on first use, shared by every generator in the process
+# (keyed by object name and by draw function; silhouettes by display list)
+_display_lists = {}
+_silhouettes = {}
+
+
+def get_display_list(object_type):
+    """Compiled display list for a vector object (unknown names use the circle).
+    
+    Objects drawn by the same function (star and starfish, unknown names and
+    circle) share one display list, so documents can share one form for them.
+    """
+    display_list = _display_lists.get(object_type)
+    if display_list is None:
+        draw_func = VECTOR_METHODS.get(object_type, VectorGraphicsLibrary.draw_circle)
+        display_list = _display_lists.get(draw_func)
+        if display_list is None:
+            display_list = _display_lists[draw_func] = DisplayList(draw_func)
+        _display_lists[object_type] = display_list
+    return display_list
+
+
+def get_silhouette(object_type):
+    """Level-of-detail silhouette of a vector object (see SilhouetteList)"""
+    display_list = get_display_list(object_type)
+    silhouette = _silhouettes.get(display_list)
+    if silhouette is None:
+        silhouette = _silhouettes[display_list] = SilhouetteList(display_list)
+    return silhouette